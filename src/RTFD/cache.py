@@ -1,19 +1,21 @@
 """
 Cache manager using SQLite for storing library search results.
+
+Also provides a small in-memory TTL cache for process-local provider memoization.
 """
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from .utils import safe_json_loads
+from .utils import json_dumps, safe_json_loads
 
 
 @dataclass
@@ -110,9 +112,9 @@ class CacheManager:
                     """,
                     (
                         key,
-                        json.dumps(data),
+                        json_dumps(data),
                         time.time(),
-                        json.dumps(metadata) if metadata else None,
+                        json_dumps(metadata) if metadata else None,
                     ),
                 )
                 conn.commit()
@@ -272,3 +274,76 @@ class CacheManager:
         else:
             preview = str(data)[:max_length]
             return preview
+
+
+class TTLCache:
+    """
+    Bounded in-memory LRU cache with per-entry expiry.
+
+    Intended for short-lived provider memoization (e.g. API payloads reused across
+    tool calls in one session) where a SQLite round trip would cost more than the
+    work being saved. A maxsize of 0 disables storage entirely.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used entries are evicted.
+            ttl: Default time-to-live in seconds for new entries.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Retrieve a live entry and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            Cached value, or default.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        """
+        Store an entry, evicting the least recently used ones beyond maxsize.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Optional per-entry time-to-live overriding the default.
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Any) -> None:
+        """Remove an entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
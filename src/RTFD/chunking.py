@@ -7,7 +7,6 @@ to request additional content incrementally.
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import time
@@ -15,7 +14,7 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-from .utils import safe_json_loads
+from .utils import json_dumps, safe_json_loads
 
 
 class ChunkingManager:
@@ -82,7 +81,7 @@ class ChunkingManager:
                     (
                         token,
                         remaining_content,
-                        json.dumps(metadata),
+                        json_dumps(metadata),
                         time.time(),
                     ),
                 )
@@ -204,8 +204,27 @@ def prioritize_sections(sections: list[Section], max_bytes: int = 20480) -> str:
     Returns:
         Combined Markdown content
     """
+    return prioritize_sections_with_size(sections, max_bytes)[0]
+
+
+def prioritize_sections_with_size(
+    sections: list[Section], max_bytes: int = 20480
+) -> tuple[str, int]:
+    """
+    Select and combine sections by priority, also returning the UTF-8 byte size.
+
+    The size is derived from the precomputed Section.size_bytes, so callers that
+    report it don't need to re-encode the combined content.
+
+    Args:
+        sections: List of sections to prioritize
+        max_bytes: Maximum total size in bytes (default ~20KB)
+
+    Returns:
+        Tuple of (combined Markdown content, its size in bytes)
+    """
     if not sections:
-        return ""
+        return "", 0
 
     # Always include first section (title + intro)
     result = [sections[0]]
@@ -213,7 +232,8 @@ def prioritize_sections(sections: list[Section], max_bytes: int = 20480) -> str:
 
     # If first section exceeds limit, truncate it
     if sections[0].size_bytes > max_bytes:
-        return smart_truncate(sections[0].content, max_bytes)
+        truncated = smart_truncate(sections[0].content, max_bytes)
+        return truncated, len(truncated.encode("utf-8"))
 
     # Sort remaining sections by priority (highest first)
     sorted_sections = sorted(sections[1:], key=lambda s: s.priority, reverse=True)
@@ -229,7 +249,31 @@ def prioritize_sections(sections: list[Section], max_bytes: int = 20480) -> str:
     result_dict = {id(s): s for s in result}
     ordered_result = [s for s in sections if id(s) in result_dict]
 
-    return "\n\n".join(s.content for s in ordered_result)
+    # Sections are joined with "\n\n" (2 bytes each)
+    size_bytes = sum(s.size_bytes for s in ordered_result) + 2 * (len(ordered_result) - 1)
+    return "\n\n".join(s.content for s in ordered_result), size_bytes
+
+
+def utf8_cut(buf: bytes | bytearray, max_bytes: int) -> int:
+    """
+    Find the largest cut point <= max_bytes that does not split a UTF-8 character.
+
+    Backs up over continuation bytes (0b10xxxxxx), so at most three steps are taken
+    for valid UTF-8.
+
+    Args:
+        buf: UTF-8 encoded data
+        max_bytes: Desired cut point
+
+    Returns:
+        Index at which buf can be sliced cleanly
+    """
+    if max_bytes >= len(buf):
+        return len(buf)
+    cut = max(max_bytes, 0)
+    while cut > 0 and buf[cut] & 0xC0 == 0x80:
+        cut -= 1
+    return cut
 
 
 def smart_truncate(text: str, max_bytes: int) -> str:
@@ -249,26 +293,17 @@ def smart_truncate(text: str, max_bytes: int) -> str:
         return ""
 
     # If already under limit, return as-is
-    if len(text.encode("utf-8")) <= max_bytes:
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
         return text
 
     # Try to find a good breaking point
     # Priority: paragraph > sentence > word > character
-    encoded = text.encode("utf-8")
 
-    # Start with max_bytes and work backwards
-    truncate_point = max_bytes
-
-    # Decode with truncation, handling potential multi-byte character splits
-    while truncate_point > 0:
-        try:
-            truncated = encoded[:truncate_point].decode("utf-8")
-            break
-        except UnicodeDecodeError:
-            # Hit a multi-byte character boundary, try one byte earlier
-            truncate_point -= 1
-    else:
+    truncate_point = utf8_cut(encoded, max_bytes)
+    if truncate_point <= 0:
         return ""
+    truncated = encoded[:truncate_point].decode("utf-8")
 
     # Try to find paragraph break (double newline)
     last_para = truncated.rfind("\n\n")
@@ -298,19 +333,11 @@ def smart_truncate(text: str, max_bytes: int) -> str:
         return "." * max_bytes
 
     # Recalculate truncation point allowing for ellipsis
-    encoded = text.encode("utf-8")
-    truncate_point = max_bytes - 3
-
-    while truncate_point > 0:
-        try:
-            truncated = encoded[:truncate_point].decode("utf-8")
-            break
-        except UnicodeDecodeError:
-            truncate_point -= 1
-    else:
-        return "." * max_bytes if max_bytes <= 3 else "..."
-
-    return truncated.strip() + "..."
+    truncate_point = utf8_cut(encoded, max_bytes - 3)
+    if truncate_point <= 0:
+        return "..."
+
+    return encoded[:truncate_point].decode("utf-8").strip() + "..."
 
 
 def convert_relative_urls(markdown: str, base_url: str) -> str:
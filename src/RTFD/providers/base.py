@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
+from loguru import logger
 
 
 @dataclass
@@ -72,6 +74,8 @@ class BaseProvider(ABC):
             http_client_factory: Async function that returns configured httpx.AsyncClient
         """
         self._http_client_factory = http_client_factory
+        self._shared_client: httpx.AsyncClient | None = None
+        self._shared_client_lock = asyncio.Lock()
 
     @abstractmethod
     def get_metadata(self) -> ProviderMetadata:
@@ -109,3 +113,25 @@ class BaseProvider(ABC):
     async def _http_client(self) -> httpx.AsyncClient:
         """Get configured HTTP client instance."""
         return await self._http_client_factory()
+
+    async def _shared_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the provider's long-lived HTTP client, creating it on first use.
+
+        Unlike _http_client(), the client is reused across calls so keep-alive
+        connections are shared. Do not close it with ``async with``; it is released
+        by aclose().
+        """
+        async with self._shared_client_lock:
+            if self._shared_client is None or self._shared_client.is_closed:
+                # Each new client pays fresh TCP/TLS handshakes; seeing this more than
+                # once per provider outside aclose() means connections are being discarded.
+                logger.debug("Creating shared HTTP client for {}", type(self).__name__)
+                self._shared_client = await self._http_client()
+            return self._shared_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        client, self._shared_client = self._shared_client, None
+        if client is not None:
+            await client.aclose()
@@ -86,13 +86,13 @@ class CratesProvider(BaseProvider):
         await self._rate_limit()
 
         try:
-            async with await self._http_client() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/crates",
-                    params={"q": query, "per_page": min(per_page, 100), "page": 1},
-                )
-                response.raise_for_status()
-                data = safe_json_loads(response.text)
+            client = await self._shared_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/crates",
+                params={"q": query, "per_page": min(per_page, 100), "page": 1},
+            )
+            response.raise_for_status()
+            data = safe_json_loads(response.content)
 
             # Format the response
             crates = data.get("crates", [])
@@ -136,10 +136,10 @@ class CratesProvider(BaseProvider):
         await self._rate_limit()
 
         try:
-            async with await self._http_client() as client:
-                response = await client.get(f"{self.BASE_URL}/crates/{crate_name}")
-                response.raise_for_status()
-                data = safe_json_loads(response.text)
+            client = await self._shared_http_client()
+            response = await client.get(f"{self.BASE_URL}/crates/{crate_name}")
+            response.raise_for_status()
+            data = safe_json_loads(response.content)
 
             crate = data.get("crate", {})
             version = data.get("versions", [{}])[0] if data.get("versions") else {}
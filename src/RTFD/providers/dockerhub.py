@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from collections.abc import Callable
 from typing import Any
 
 import httpx
 from mcp.types import CallToolResult
 
+from ..cache import TTLCache
+from ..rate_limit import TokenBucket, retry_after_seconds
 from ..utils import (
     chunk_and_serialize_response,
+    get_cache_config,
     is_fetch_enabled,
     safe_json_loads,
     serialize_response_with_meta,
@@ -21,6 +26,27 @@ class DockerHubProvider(BaseProvider):
     """Provider for DockerHub Docker image metadata and search."""
 
     DOCKERHUB_API_URL = "https://hub.docker.com/v2"
+    MAX_CONCURRENCY = 8  # Simultaneous requests to hub.docker.com
+    DEFAULT_RATE_LIMIT = 5.0  # Requests per second, override with DOCKERHUB_RATE_LIMIT
+    REPOSITORY_CACHE_SIZE = 128  # Raw repository payloads kept in memory
+    REPOSITORY_CACHE_TTL = 300.0  # Seconds before a repository payload is re-fetched
+
+    def __init__(self, http_client_factory: Callable):
+        """Initialize provider with HTTP client factory, rate limiting, and metadata cache."""
+        super().__init__(http_client_factory)
+        try:
+            rate = float(os.getenv("DOCKERHUB_RATE_LIMIT", str(self.DEFAULT_RATE_LIMIT)))
+        except ValueError:
+            rate = self.DEFAULT_RATE_LIMIT
+
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._bucket = TokenBucket(rate)
+
+        cache_enabled, _ = get_cache_config()
+        self._repository_cache = TTLCache(
+            maxsize=self.REPOSITORY_CACHE_SIZE if cache_enabled else 0,
+            ttl=self.REPOSITORY_CACHE_TTL,
+        )
 
     def get_metadata(self) -> ProviderMetadata:
         tool_names = ["search_docker_images", "docker_image_metadata"]
@@ -47,7 +73,7 @@ class DockerHubProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=False,  # DockerHub search is image-centric, not lib-doc
             required_env_vars=[],
-            optional_env_vars=[],
+            optional_env_vars=["DOCKERHUB_RATE_LIMIT"],
             tool_tiers=tool_tiers,
         )
 
@@ -55,6 +81,89 @@ class DockerHubProvider(BaseProvider):
         """Not used for DockerHub (images are searched via search_docker_images)."""
         return ProviderResult(success=False, error=None, provider_name="dockerhub")
 
+    async def _hub_get(self, client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        GET a hub.docker.com URL with bounded concurrency and request pacing.
+
+        A 429 response is retried once after honoring its Retry-After header.
+        """
+        async with self._semaphore:
+            await self._bucket.acquire()
+            resp = await client.get(url, **kwargs)
+            if resp.status_code == 429:
+                await asyncio.sleep(retry_after_seconds(resp))
+                await self._bucket.acquire()
+                resp = await client.get(url, **kwargs)
+            return resp
+
+    @staticmethod
+    def _to_repo_path(image: str) -> str:
+        """Map an image name to its repository path ('nginx' -> 'library/nginx')."""
+        return image if "/" in image else f"library/{image}"
+
+    async def _fetch_repository(self, repo_path: str) -> dict[str, Any]:
+        """
+        Fetch the raw repository payload, reusing a fresh in-memory copy when available.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        data = self._repository_cache.get(repo_path)
+        if data is not None:
+            return data
+
+        url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
+        client = await self._shared_http_client()
+        resp = await self._hub_get(client, url)
+        resp.raise_for_status()
+        data = safe_json_loads(resp.content)
+
+        self._repository_cache.set(repo_path, data)
+        return data
+
+    @staticmethod
+    def _normalize_metadata(data: dict[str, Any], repo_path: str) -> dict[str, Any]:
+        """Shape a raw repository payload into the metadata returned by the tools."""
+        return {
+            "name": data.get("name"),
+            "namespace": data.get("namespace"),
+            "full_name": data.get("full_name", f"{data.get('namespace')}/{data.get('name')}"),
+            "description": data.get("description", ""),
+            "readme": data.get("readme", ""),  # Full readme text if available
+            "last_updated": data.get("last_updated"),
+            "star_count": data.get("star_count", 0),
+            "pull_count": data.get("pull_count", 0),
+            "is_official": data.get("is_official", False),
+            "is_private": data.get("is_private", False),
+            "repository_type": data.get("repository_type"),
+            "url": f"https://hub.docker.com/r/{repo_path}",
+        }
+
+    def _get_cached_metadata(self, repo_path: str) -> dict[str, Any] | None:
+        """Return normalized metadata from the in-memory cache, or None on a miss."""
+        data = self._repository_cache.get(repo_path)
+        if data is None:
+            return None
+        return self._normalize_metadata(data, repo_path)
+
+    @staticmethod
+    def _format_search_result(item: dict[str, Any]) -> dict[str, Any]:
+        """Shape one search API result into the fields returned by search_docker_images."""
+        repo_name = item.get("repo_name", "")
+        repo_owner = item.get("repo_owner", "")
+        # For official images, repo_owner is empty, show as library/name
+        display_name = f"{repo_owner}/{repo_name}" if repo_owner else f"library/{repo_name}"
+
+        return {
+            "name": repo_name,
+            "owner": repo_owner or "library",
+            "description": item.get("short_description", ""),
+            "star_count": item.get("star_count", 0),
+            "pull_count": item.get("pull_count", 0),
+            "is_official": item.get("is_official", False),
+            "url": f"https://hub.docker.com/r/{display_name}",
+        }
+
     async def _search_images(self, query: str, limit: int = 5) -> dict[str, Any]:
         """Search for Docker images on DockerHub.
 
@@ -69,30 +178,13 @@ class DockerHubProvider(BaseProvider):
             url = f"{self.DOCKERHUB_API_URL}/search/repositories/"
             params = {"query": query, "page_size": limit}
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                payload = safe_json_loads(resp.text)
+            client = await self._shared_http_client()
+            resp = await self._hub_get(client, url, params=params)
+            resp.raise_for_status()
+            payload = safe_json_loads(resp.content)
 
             # Transform results
-            results = []
-            for item in payload.get("results", []):
-                repo_name = item.get("repo_name", "")
-                repo_owner = item.get("repo_owner", "")
-                # For official images, repo_owner is empty, show as library/name
-                display_name = f"{repo_owner}/{repo_name}" if repo_owner else f"library/{repo_name}"
-
-                results.append(
-                    {
-                        "name": repo_name,
-                        "owner": repo_owner or "library",
-                        "description": item.get("short_description", ""),
-                        "star_count": item.get("star_count", 0),
-                        "pull_count": item.get("pull_count", 0),
-                        "is_official": item.get("is_official", False),
-                        "url": f"https://hub.docker.com/r/{display_name}",
-                    }
-                )
+            results = [self._format_search_result(item) for item in payload.get("results", [])]
 
             return {
                 "query": query,
@@ -129,33 +221,9 @@ class DockerHubProvider(BaseProvider):
             Dict with image metadata
         """
         try:
-            # Handle library images (e.g., 'nginx' -> 'library/nginx')
-            if "/" not in image:
-                repo_path = f"library/{image}"
-            else:
-                repo_path = image
-
-            url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
-
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
-
-            return {
-                "name": data.get("name"),
-                "namespace": data.get("namespace"),
-                "full_name": data.get("full_name", f"{data.get('namespace')}/{data.get('name')}"),
-                "description": data.get("description", ""),
-                "readme": data.get("readme", ""),  # Full readme text if available
-                "last_updated": data.get("last_updated"),
-                "star_count": data.get("star_count", 0),
-                "pull_count": data.get("pull_count", 0),
-                "is_official": data.get("is_official", False),
-                "is_private": data.get("is_private", False),
-                "repository_type": data.get("repository_type"),
-                "url": f"https://hub.docker.com/r/{repo_path}",
-            }
+            repo_path = self._to_repo_path(image)
+            data = await self._fetch_repository(repo_path)
+            return self._normalize_metadata(data, repo_path)
 
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 404:
@@ -189,7 +257,9 @@ class DockerHubProvider(BaseProvider):
             Dict with documentation content
         """
         try:
-            metadata = await self._fetch_image_metadata(image)
+            metadata = self._get_cached_metadata(self._to_repo_path(image))
+            if metadata is None:
+                metadata = await self._fetch_image_metadata(image)
 
             # Check if we got an error
             if "error" in metadata:
@@ -251,40 +321,20 @@ class DockerHubProvider(BaseProvider):
         import re
 
         try:
-            # 1. Get image metadata to find the description
-            metadata = await self._fetch_image_metadata(image)
-            if "error" in metadata:
-                return {
-                    "image": image,
-                    "error": metadata["error"],
-                    "source": None,
-                }
-
-            # 2. Get the full description (README)
-            # Note: _fetch_image_metadata might not return full_description if it uses the summary endpoint,
-            # but let's check if we need to make a separate call or if we can rely on what we have.
-            # The previous investigation showed we need to hit the repository endpoint which _fetch_image_metadata does.
-            # However, the 'readme' field in _fetch_image_metadata comes from 'readme' key in JSON.
-            # Let's verify if 'full_description' is available in the payload of _fetch_image_metadata.
-            # Looking at _fetch_image_metadata implementation:
-            # url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
-            # This endpoint returns 'full_description' usually.
-            # But _fetch_image_metadata returns a dict with specific keys.
-            # We need to access the raw description.
-
-            # Let's re-fetch to be sure we get the full description text to parse
-            if "/" not in image:
-                repo_path = f"library/{image}"
-            else:
-                repo_path = image
-
-            url = f"{self.DOCKERHUB_API_URL}/repositories/{repo_path}/"
-
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
+            # 1. Get the raw repository payload, which carries the full description (README).
+            # Metadata errors (404 etc.) are surfaced through _fetch_image_metadata.
+            repo_path = self._to_repo_path(image)
+            if self._get_cached_metadata(repo_path) is None:
+                metadata = await self._fetch_image_metadata(image)
+                if "error" in metadata:
+                    return {
+                        "image": image,
+                        "error": metadata["error"],
+                        "source": None,
+                    }
 
+            # 2. Served from the in-memory cache populated above (re-fetched if caching is off)
+            data = await self._fetch_repository(repo_path)
             full_desc = data.get("full_description", "")
 
             # 3. Find GitHub Dockerfile links
@@ -314,10 +364,10 @@ class DockerHubProvider(BaseProvider):
             )
 
             # 5. Fetch the Dockerfile
-            async with await self._http_client() as client:
-                resp = await client.get(raw_url)
-                resp.raise_for_status()
-                content = resp.text
+            client = await self._shared_http_client()
+            resp = await client.get(raw_url)
+            resp.raise_for_status()
+            content = resp.text
 
             return {
                 "image": image,
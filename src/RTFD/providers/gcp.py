@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+import asyncio
+import functools
+import os
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
 import httpx
 from bs4 import BeautifulSoup
 from mcp.types import CallToolResult
 
-from ..content_utils import extract_sections, html_to_markdown, prioritize_sections
+from ..cache import TTLCache
+from ..content_utils import (
+    extract_sections,
+    html_to_markdown,
+    prioritize_sections_with_size,
+    utf8_cut,
+)
 from ..utils import (
     USER_AGENT,
     chunk_and_serialize_response,
+    get_cache_config,
     get_github_token,
     is_fetch_enabled,
     safe_json_loads,
@@ -20,134 +32,298 @@ from ..utils import (
 )
 from .base import BaseProvider, ProviderMetadata, ProviderResult, ToolTierInfo
 
+try:
+    import lxml  # noqa: F401
+
+    # C-backed parser: much faster and lighter than html.parser on large docs pages
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    # Keeps the DOM in C and only materializes queried nodes; BeautifulSoup is the fallback
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Candidate containers for the main documentation body, matched in a single pass
+MAIN_CONTENT_SELECTOR = "main, div.devsite-article-body, article"
+# Preference among those matches by tag (lower wins), regardless of document order:
+# an <article> wrapping div.devsite-article-body must not win just by coming first
+MAIN_CONTENT_RANKS = {"main": 0, "div": 1, "article": 2}
+
+# Non-content elements stripped from the main documentation body
+UNWANTED_SELECTORS = "nav, aside, footer, header, script, style"
+
+_Node = TypeVar("_Node")
+
+
+def _best_main_content(nodes: Iterable[_Node], tag_of: Callable[[_Node], str]) -> _Node | None:
+    """
+    Pick the preferred main content node from one pass over MAIN_CONTENT_SELECTOR matches.
+
+    Args:
+        nodes: Matched nodes in document order
+        tag_of: Returns a node's tag name
+
+    Returns:
+        Highest-ranked node, or None if there were no matches
+    """
+    best, best_rank = None, len(MAIN_CONTENT_RANKS)
+    for node in nodes:
+        rank = MAIN_CONTENT_RANKS[tag_of(node)]
+        if rank < best_rank:
+            best, best_rank = node, rank
+            if rank == 0:
+                break
+    return best
+
+
+def use_selectolax() -> bool:
+    """
+    Check if GCP pages should be parsed with selectolax.
+
+    Controlled by RTFD_GCP_HTML_PARSER environment variable (default: selectolax).
+    Set to 'bs4' to use BeautifulSoup instead. Falls back to BeautifulSoup when
+    selectolax is not installed.
+    """
+    if LexborHTMLParser is None:
+        return False
+    return os.getenv("RTFD_GCP_HTML_PARSER", "selectolax").lower() != "bs4"
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceInfo:
+    """Static description of a GCP service in the local mapping."""
+
+    name: str  # Display name, e.g. "Cloud Storage"
+    url: str  # Documentation root URL
+    api: str  # API endpoint, e.g. "storage.googleapis.com"
+    description: str  # One-line summary
+
+    def to_result(self, source: str, description: str | None = None) -> dict[str, Any]:
+        """
+        Build a search result dict for this service.
+
+        Every search backend shapes its results through here. Results stay plain dicts
+        because the aggregator, serializers, and _fetch_service_docs consume them as such.
+
+        Args:
+            source: Result source label (e.g. "gcp_mapping")
+            description: Optional description overriding the default summary
+
+        Returns:
+            JSON-serializable result dict
+        """
+        return {
+            "name": self.name,
+            "description": self.description if description is None else description,
+            "api": self.api,
+            "docs_url": self.url,
+            "source": source,
+        }
+
+
 # Mapping of common GCP services to their documentation URLs
-GCP_SERVICE_DOCS = {
-    "storage": {
-        "name": "Cloud Storage",
-        "url": "https://cloud.google.com/storage/docs",
-        "api": "storage.googleapis.com",
-        "description": "Object storage for companies of all sizes",
-    },
-    "compute": {
-        "name": "Compute Engine",
-        "url": "https://cloud.google.com/compute/docs",
-        "api": "compute.googleapis.com",
-        "description": "Virtual machines running in Google's data centers",
-    },
-    "bigquery": {
-        "name": "BigQuery",
-        "url": "https://cloud.google.com/bigquery/docs",
-        "api": "bigquery.googleapis.com",
-        "description": "Serverless, highly scalable, and cost-effective multicloud data warehouse",
-    },
-    "cloudfunctions": {
-        "name": "Cloud Functions",
-        "url": "https://cloud.google.com/functions/docs",
-        "api": "cloudfunctions.googleapis.com",
-        "description": "Event-driven serverless compute platform",
-    },
-    "run": {
-        "name": "Cloud Run",
-        "url": "https://cloud.google.com/run/docs",
-        "api": "run.googleapis.com",
-        "description": "Fully managed compute platform for deploying and scaling containerized applications",
-    },
-    "pubsub": {
-        "name": "Pub/Sub",
-        "url": "https://cloud.google.com/pubsub/docs",
-        "api": "pubsub.googleapis.com",
-        "description": "Asynchronous and scalable messaging service",
-    },
-    "firestore": {
-        "name": "Cloud Firestore",
-        "url": "https://cloud.google.com/firestore/docs",
-        "api": "firestore.googleapis.com",
-        "description": "NoSQL document database for mobile, web, and server development",
-    },
-    "datastore": {
-        "name": "Cloud Datastore",
-        "url": "https://cloud.google.com/datastore/docs",
-        "api": "datastore.googleapis.com",
-        "description": "Highly scalable NoSQL database for web and mobile applications",
-    },
-    "bigtable": {
-        "name": "Cloud Bigtable",
-        "url": "https://cloud.google.com/bigtable/docs",
-        "api": "bigtable.googleapis.com",
-        "description": "Fully managed, scalable NoSQL database service for large analytical and operational workloads",
-    },
-    "spanner": {
-        "name": "Cloud Spanner",
-        "url": "https://cloud.google.com/spanner/docs",
-        "api": "spanner.googleapis.com",
-        "description": "Fully managed, mission-critical, relational database service with transactional consistency",
-    },
-    "sql": {
-        "name": "Cloud SQL",
-        "url": "https://cloud.google.com/sql/docs",
-        "api": "sqladmin.googleapis.com",
-        "description": "Fully managed relational database service for MySQL, PostgreSQL, and SQL Server",
-    },
-    "gke": {
-        "name": "Google Kubernetes Engine",
-        "url": "https://cloud.google.com/kubernetes-engine/docs",
-        "api": "container.googleapis.com",
-        "description": "Managed Kubernetes service for running containerized applications",
-    },
-    "appengine": {
-        "name": "App Engine",
-        "url": "https://cloud.google.com/appengine/docs",
-        "api": "appengine.googleapis.com",
-        "description": "Platform for building scalable web applications and mobile backends",
-    },
-    "vision": {
-        "name": "Cloud Vision API",
-        "url": "https://cloud.google.com/vision/docs",
-        "api": "vision.googleapis.com",
-        "description": "Image analysis powered by machine learning",
-    },
-    "speech": {
-        "name": "Cloud Speech-to-Text",
-        "url": "https://cloud.google.com/speech-to-text/docs",
-        "api": "speech.googleapis.com",
-        "description": "Speech to text conversion powered by machine learning",
-    },
-    "translate": {
-        "name": "Cloud Translation API",
-        "url": "https://cloud.google.com/translate/docs",
-        "api": "translate.googleapis.com",
-        "description": "Dynamically translate between languages",
-    },
-    "monitoring": {
-        "name": "Cloud Monitoring",
-        "url": "https://cloud.google.com/monitoring/docs",
-        "api": "monitoring.googleapis.com",
-        "description": "Visibility into the performance, availability, and health of your applications",
-    },
-    "logging": {
-        "name": "Cloud Logging",
-        "url": "https://cloud.google.com/logging/docs",
-        "api": "logging.googleapis.com",
-        "description": "Store, search, analyze, monitor, and alert on logging data and events",
-    },
-    "iam": {
-        "name": "Identity and Access Management",
-        "url": "https://cloud.google.com/iam/docs",
-        "api": "iam.googleapis.com",
-        "description": "Manage access control by defining who (identity) has what access (role) for which resource",
-    },
-    "secretmanager": {
-        "name": "Secret Manager",
-        "url": "https://cloud.google.com/secret-manager/docs",
-        "api": "secretmanager.googleapis.com",
-        "description": "Store and manage access to secrets",
-    },
+GCP_SERVICE_DOCS: dict[str, ServiceInfo] = {
+    "storage": ServiceInfo(
+        name="Cloud Storage",
+        url="https://cloud.google.com/storage/docs",
+        api="storage.googleapis.com",
+        description="Object storage for companies of all sizes",
+    ),
+    "compute": ServiceInfo(
+        name="Compute Engine",
+        url="https://cloud.google.com/compute/docs",
+        api="compute.googleapis.com",
+        description="Virtual machines running in Google's data centers",
+    ),
+    "bigquery": ServiceInfo(
+        name="BigQuery",
+        url="https://cloud.google.com/bigquery/docs",
+        api="bigquery.googleapis.com",
+        description="Serverless, highly scalable, and cost-effective multicloud data warehouse",
+    ),
+    "cloudfunctions": ServiceInfo(
+        name="Cloud Functions",
+        url="https://cloud.google.com/functions/docs",
+        api="cloudfunctions.googleapis.com",
+        description="Event-driven serverless compute platform",
+    ),
+    "run": ServiceInfo(
+        name="Cloud Run",
+        url="https://cloud.google.com/run/docs",
+        api="run.googleapis.com",
+        description="Fully managed compute platform for deploying and scaling containerized applications",
+    ),
+    "pubsub": ServiceInfo(
+        name="Pub/Sub",
+        url="https://cloud.google.com/pubsub/docs",
+        api="pubsub.googleapis.com",
+        description="Asynchronous and scalable messaging service",
+    ),
+    "firestore": ServiceInfo(
+        name="Cloud Firestore",
+        url="https://cloud.google.com/firestore/docs",
+        api="firestore.googleapis.com",
+        description="NoSQL document database for mobile, web, and server development",
+    ),
+    "datastore": ServiceInfo(
+        name="Cloud Datastore",
+        url="https://cloud.google.com/datastore/docs",
+        api="datastore.googleapis.com",
+        description="Highly scalable NoSQL database for web and mobile applications",
+    ),
+    "bigtable": ServiceInfo(
+        name="Cloud Bigtable",
+        url="https://cloud.google.com/bigtable/docs",
+        api="bigtable.googleapis.com",
+        description="Fully managed, scalable NoSQL database service for large analytical and operational workloads",
+    ),
+    "spanner": ServiceInfo(
+        name="Cloud Spanner",
+        url="https://cloud.google.com/spanner/docs",
+        api="spanner.googleapis.com",
+        description="Fully managed, mission-critical, relational database service with transactional consistency",
+    ),
+    "sql": ServiceInfo(
+        name="Cloud SQL",
+        url="https://cloud.google.com/sql/docs",
+        api="sqladmin.googleapis.com",
+        description="Fully managed relational database service for MySQL, PostgreSQL, and SQL Server",
+    ),
+    "gke": ServiceInfo(
+        name="Google Kubernetes Engine",
+        url="https://cloud.google.com/kubernetes-engine/docs",
+        api="container.googleapis.com",
+        description="Managed Kubernetes service for running containerized applications",
+    ),
+    "appengine": ServiceInfo(
+        name="App Engine",
+        url="https://cloud.google.com/appengine/docs",
+        api="appengine.googleapis.com",
+        description="Platform for building scalable web applications and mobile backends",
+    ),
+    "vision": ServiceInfo(
+        name="Cloud Vision API",
+        url="https://cloud.google.com/vision/docs",
+        api="vision.googleapis.com",
+        description="Image analysis powered by machine learning",
+    ),
+    "speech": ServiceInfo(
+        name="Cloud Speech-to-Text",
+        url="https://cloud.google.com/speech-to-text/docs",
+        api="speech.googleapis.com",
+        description="Speech to text conversion powered by machine learning",
+    ),
+    "translate": ServiceInfo(
+        name="Cloud Translation API",
+        url="https://cloud.google.com/translate/docs",
+        api="translate.googleapis.com",
+        description="Dynamically translate between languages",
+    ),
+    "monitoring": ServiceInfo(
+        name="Cloud Monitoring",
+        url="https://cloud.google.com/monitoring/docs",
+        api="monitoring.googleapis.com",
+        description="Visibility into the performance, availability, and health of your applications",
+    ),
+    "logging": ServiceInfo(
+        name="Cloud Logging",
+        url="https://cloud.google.com/logging/docs",
+        api="logging.googleapis.com",
+        description="Store, search, analyze, monitor, and alert on logging data and events",
+    ),
+    "iam": ServiceInfo(
+        name="Identity and Access Management",
+        url="https://cloud.google.com/iam/docs",
+        api="iam.googleapis.com",
+        description="Manage access control by defining who (identity) has what access (role) for which resource",
+    ),
+    "secretmanager": ServiceInfo(
+        name="Secret Manager",
+        url="https://cloud.google.com/secret-manager/docs",
+        api="secretmanager.googleapis.com",
+        description="Store and manage access to secrets",
+    ),
+}
+
+# Prefixes stripped from queries before matching service keys
+SERVICE_PREFIXES = ("google cloud ", "cloud ", "gcp ", "google ")
+
+# Each prefix is optional and stripped in order, e.g. "gcp google storage" -> "storage"
+_SERVICE_PREFIX_RE = re.compile("^" + "".join(f"(?:{re.escape(p)})?" for p in SERVICE_PREFIXES))
+
+# Common aliases for service keys
+SERVICE_ALIASES = {
+    "kubernetes": "gke",
+    "k8s": "gke",
+    "functions": "cloudfunctions",
+    "cloudrun": "run",
+    "pub/sub": "pubsub",
+    "cloud functions": "cloudfunctions",
+    "cloud run": "run",
+    "cloud storage": "storage",
+    "compute engine": "compute",
+    "big query": "bigquery",
+    "app engine": "appengine",
+    "secret manager": "secretmanager",
+}
+
+# Lowercased (name, description) per service, built once for partial-match search
+_SERVICE_SEARCH_INDEX = {
+    key: (info.name.lower(), info.description.lower()) for key, info in GCP_SERVICE_DOCS.items()
 }
 
+# Position of each service in GCP_SERVICE_DOCS, used to keep results in mapping order
+_SERVICE_ORDER = {key: index for index, key in enumerate(GCP_SERVICE_DOCS)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _services_matching_word(word: str) -> frozenset[str]:
+    """
+    Get the keys of services whose name, key, or description contains word.
+
+    Works as a word -> services inverted index filled on demand: the mapping is
+    static, so each word is scanned against the catalog once and memoized. Matching
+    stays substring-based (e.g. "kube" finds Kubernetes Engine).
+
+    Args:
+        word: Lowercased query word
+
+    Returns:
+        Set of matching GCP_SERVICE_DOCS keys
+    """
+    return frozenset(
+        key
+        for key, (name_lower, description_lower) in _SERVICE_SEARCH_INDEX.items()
+        if word in name_lower or word in key or word in description_lower
+    )
+
 
 class GcpProvider(BaseProvider):
     """Provider for Google Cloud Platform documentation."""
 
+    SEARCH_CACHE_SIZE = 256  # Distinct (query, limit) pairs kept in memory
+    LOCAL_SEARCH_TTL = 86400.0  # Local mapping results only change with the code
+    REMOTE_SEARCH_TTL = 300.0  # cloud.google.com / GitHub results can go stale
+    DOCS_CACHE_SIZE = 64  # Extracted docs pages kept in memory
+    DOCS_CACHE_TTL = 3600.0  # Seconds before a docs page is re-fetched
+    DOCS_HTML_BUDGET_FACTOR = 4  # Raw HTML bytes read per byte of requested content
+    DOCS_HTML_MIN_BYTES = 512 * 1024  # Floor so <main> is still reached past large page heads
+
+    def __init__(self, http_client_factory: Callable):
+        """Initialize provider with HTTP client factory and search/docs caches."""
+        super().__init__(http_client_factory)
+        cache_enabled, _ = get_cache_config()
+        self._search_cache = TTLCache(maxsize=self.SEARCH_CACHE_SIZE if cache_enabled else 0)
+        self._docs_cache = TTLCache(
+            maxsize=self.DOCS_CACHE_SIZE if cache_enabled else 0, ttl=self.DOCS_CACHE_TTL
+        )
+        self._inflight_searches: dict[tuple[str, int], asyncio.Future] = {}
+        # (GITHUB_AUTH, GITHUB_TOKEN) the cached GitHub headers were built for
+        self._github_headers: tuple[tuple[str | None, str | None], dict[str, str]] | None = None
+
     def get_metadata(self) -> ProviderMetadata:
         tool_names = ["search_gcp_services"]
         if is_fetch_enabled():
@@ -168,7 +344,7 @@ class GcpProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=True,
             required_env_vars=[],
-            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH"],
+            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH", "RTFD_GCP_HTML_PARSER"],
             tool_tiers=tool_tiers,
         )
 
@@ -191,10 +367,14 @@ class GcpProvider(BaseProvider):
             # Parsing errors or other issues - silent fail
             return ProviderResult(success=False, error=None, provider_name="gcp")
 
-    def _normalize_service_name(self, query: str) -> str | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_service_name(query: str) -> str | None:
         """
         Normalize service name to match our mapping keys.
 
+        Results depend only on the static mapping, so they are memoized.
+
         Args:
             query: User query (e.g., "cloud storage", "gke", "kubernetes")
 
@@ -208,31 +388,14 @@ class GcpProvider(BaseProvider):
             return query_lower
 
         # Remove "cloud" and "google" prefixes
-        for prefix in ["google cloud ", "cloud ", "gcp ", "google "]:
-            if query_lower.startswith(prefix):
-                query_lower = query_lower[len(prefix) :]
+        query_lower = _SERVICE_PREFIX_RE.sub("", query_lower, count=1)
 
         # Check again after normalization
         if query_lower in GCP_SERVICE_DOCS:
             return query_lower
 
         # Common aliases
-        aliases = {
-            "kubernetes": "gke",
-            "k8s": "gke",
-            "functions": "cloudfunctions",
-            "cloudrun": "run",
-            "pub/sub": "pubsub",
-            "cloud functions": "cloudfunctions",
-            "cloud run": "run",
-            "cloud storage": "storage",
-            "compute engine": "compute",
-            "big query": "bigquery",
-            "app engine": "appengine",
-            "secret manager": "secretmanager",
-        }
-
-        return aliases.get(query_lower)
+        return SERVICE_ALIASES.get(query_lower)
 
     async def _search_services(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """
@@ -245,103 +408,105 @@ class GcpProvider(BaseProvider):
         Returns:
             List of matching services with metadata
         """
+        cache_key = (query.lower(), limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Coalesce identical concurrent searches (e.g. an agent fanning out the same
+        # query) onto one in-flight task. shield() keeps the shared task running if
+        # one of its waiters is cancelled.
+        task = self._inflight_searches.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_search(query, limit, cache_key))
+            self._inflight_searches[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight_searches.pop(cache_key, None))
+        return list(await asyncio.shield(task))
+
+    async def _run_search(
+        self, query: str, limit: int, cache_key: tuple[str, int]
+    ) -> list[dict[str, Any]]:
+        """
+        Run an uncached service search and store the results in the search cache.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
+            cache_key: Search cache key for this query
+
+        Returns:
+            List of matching services (shared with the cache; callers copy it)
+        """
         results: list[dict[str, Any]] = []
 
         # First, check if query matches any known service
         normalized = self._normalize_service_name(query)
         if normalized and normalized in GCP_SERVICE_DOCS:
-            service_info = GCP_SERVICE_DOCS[normalized]
-            results.append(
-                {
-                    "name": service_info["name"],
-                    "description": service_info["description"],
-                    "api": service_info["api"],
-                    "docs_url": service_info["url"],
-                    "source": "gcp_mapping",
-                }
-            )
+            results.append(GCP_SERVICE_DOCS[normalized].to_result("gcp_mapping"))
 
         # Search our local mapping for partial matches
         query_lower = query.lower()
 
         # If query has multiple words (e.g., "gke audit"), try first word as service
         query_words = query_lower.split()
-        if len(query_words) > 1 and not results:
+        first_word_normalized = (
+            self._normalize_service_name(query_words[0]) if len(query_words) > 1 else None
+        )
+        if first_word_normalized in GCP_SERVICE_DOCS and not results:
             # Try to find service from first word
-            first_word_normalized = self._normalize_service_name(query_words[0])
-            if first_word_normalized and first_word_normalized in GCP_SERVICE_DOCS:
-                service_info = GCP_SERVICE_DOCS[first_word_normalized]
-                # Add note about topic in description
-                topic = " ".join(query_words[1:])
-                results.append(
-                    {
-                        "name": service_info["name"],
-                        "description": f"{service_info['description']} (searching for: {topic})",
-                        "api": service_info["api"],
-                        "docs_url": service_info["url"],
-                        "source": "gcp_mapping_contextual",
-                    }
+            service_info = GCP_SERVICE_DOCS[first_word_normalized]
+            # Add note about topic in description
+            topic = " ".join(query_words[1:])
+            results.append(
+                service_info.to_result(
+                    "gcp_mapping_contextual",
+                    description=f"{service_info.description} (searching for: {topic})",
                 )
+            )
 
-        # Search for partial matches in service names and descriptions
-        for key, service_info in GCP_SERVICE_DOCS.items():
-            # Skip if already added
-            if normalized == key:
-                continue
-            if len(query_words) > 1 and self._normalize_service_name(query_words[0]) == key:
-                continue
-
-            # Check if ANY word in query matches service name, key, or description
-            query_matches = False
-            for word in query_words:
-                if len(word) > 2:  # Skip very short words
-                    if (
-                        word in service_info["name"].lower()
-                        or word in key
-                        or word in service_info["description"].lower()
-                    ):
-                        query_matches = True
-                        break
-
-            if query_matches:
-                results.append(
-                    {
-                        "name": service_info["name"],
-                        "description": service_info["description"],
-                        "api": service_info["api"],
-                        "docs_url": service_info["url"],
-                        "source": "gcp_mapping",
-                    }
-                )
+        # Search for partial matches, unless an exact or contextual match already
+        # fills the limit. Matches are services where ANY query word appears in the
+        # service name, key, or description, kept in mapping order. Very short words
+        # are skipped, and a query made only of them skips the scan entirely.
+        meaningful_words = [word for word in query_words if len(word) > 2]
+        if meaningful_words and len(results) < limit:
+            candidates = set().union(*map(_services_matching_word, meaningful_words))
+            for key in sorted(candidates, key=_SERVICE_ORDER.__getitem__):
+                if len(results) >= limit:
+                    break
+                # Skip if already added
+                if key in (normalized, first_word_normalized):
+                    continue
 
-            if len(results) >= limit:
-                break
+                results.append(GCP_SERVICE_DOCS[key].to_result("gcp_mapping"))
 
         # If we have results from local mapping (either exact or partial matches),
         # prioritize those over external searches
         if results:
-            return results[:limit]
-
-        # Only search cloud.google.com if we don't have local matches
-        # This is for very specific queries that aren't in our mapping
-        try:
-            cloud_results = await self._search_cloud_google_com(query, limit)
-            if cloud_results:
-                results.extend(cloud_results)
-        except Exception:
-            pass
-
-        if len(results) >= limit:
-            return results[:limit]
+            results = results[:limit]
+            self._search_cache.set(cache_key, results, ttl=self.LOCAL_SEARCH_TTL)
+            return results
 
-        # Finally, try GitHub API search for googleapis repository
-        try:
-            github_results = await self._search_github_googleapis(query, limit)
-            results.extend(github_results)
-        except Exception:
-            pass
+        # Only search externally if we don't have local matches
+        # This is for very specific queries that aren't in our mapping.
+        # cloud.google.com and the googleapis GitHub search are independent, so run
+        # them concurrently; cloud.google.com results keep precedence when merging.
+        remote_results = await asyncio.gather(
+            self._search_cloud_google_com(query, limit),
+            self._search_github_googleapis(query, limit),
+            return_exceptions=True,
+        )
+        for backend_results in remote_results:
+            # Backend failures are silent; the other backend may still have results
+            if isinstance(backend_results, BaseException):
+                continue
+            results.extend(backend_results)
 
-        return results[:limit]
+        results = results[:limit]
+        # Empty results may just mean both backends failed, so only cache hits
+        if results:
+            self._search_cache.set(cache_key, results, ttl=self.REMOTE_SEARCH_TTL)
+        return results
 
     async def _search_github_googleapis(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """
@@ -360,14 +525,14 @@ class GcpProvider(BaseProvider):
         search_query = f"{query} repo:googleapis/googleapis path:google/cloud"
         params = {"q": search_query, "per_page": str(limit)}
 
-        async with await self._http_client() as client:
-            resp = await client.get(
-                "https://api.github.com/search/code",
-                params=params,
-                headers=headers,
-            )
-            resp.raise_for_status()
-            payload = safe_json_loads(resp.text)
+        client = await self._shared_http_client()
+        resp = await client.get(
+            "https://api.github.com/search/code",
+            params=params,
+            headers=headers,
+        )
+        resp.raise_for_status()
+        payload = safe_json_loads(resp.content)
 
         results: list[dict[str, Any]] = []
         for item in payload.get("items", []):
@@ -381,26 +546,16 @@ class GcpProvider(BaseProvider):
                 service_info = GCP_SERVICE_DOCS.get(service_name)
 
                 if service_info:
-                    results.append(
-                        {
-                            "name": service_info["name"],
-                            "description": service_info["description"],
-                            "api": service_info["api"],
-                            "docs_url": service_info["url"],
-                            "source": "github_googleapis",
-                        }
-                    )
+                    results.append(service_info.to_result("github_googleapis"))
                 else:
                     # Generic result for unknown services
-                    results.append(
-                        {
-                            "name": service_name.title(),
-                            "description": f"Google Cloud {service_name} service",
-                            "api": f"{service_name}.googleapis.com",
-                            "docs_url": f"https://cloud.google.com/{service_name}/docs",
-                            "source": "github_googleapis",
-                        }
+                    generic_info = ServiceInfo(
+                        name=service_name.title(),
+                        url=f"https://cloud.google.com/{service_name}/docs",
+                        api=f"{service_name}.googleapis.com",
+                        description=f"Google Cloud {service_name} service",
                     )
+                    results.append(generic_info.to_result("github_googleapis"))
 
             if len(results) >= limit:
                 break
@@ -408,7 +563,17 @@ class GcpProvider(BaseProvider):
         return results
 
     def _get_github_headers(self) -> dict[str, str]:
-        """Build GitHub API headers with optional auth token."""
+        """
+        Build GitHub API headers with optional auth token.
+
+        Headers are cached per GITHUB_AUTH/GITHUB_TOKEN setting, so the token lookup
+        (which may shell out to the gh CLI) only reruns when that configuration changes.
+        The returned dict is shared and must not be mutated.
+        """
+        auth_config = (os.getenv("GITHUB_AUTH"), os.getenv("GITHUB_TOKEN"))
+        if self._github_headers is not None and self._github_headers[0] == auth_config:
+            return self._github_headers[1]
+
         headers = {
             "User-Agent": USER_AGENT,
             "Accept": "application/vnd.github+json",
@@ -417,6 +582,7 @@ class GcpProvider(BaseProvider):
         token = get_github_token()
         if token:
             headers["Authorization"] = f"token {token}"
+        self._github_headers = (auth_config, headers)
         return headers
 
     async def _search_cloud_google_com(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
@@ -434,20 +600,15 @@ class GcpProvider(BaseProvider):
         headers = {"User-Agent": USER_AGENT}
 
         try:
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers, follow_redirects=True)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._shared_http_client()
+            resp = await client.get(url, headers=headers, follow_redirects=True)
+            resp.raise_for_status()
+            search_links = self._extract_search_links(resp.text)
 
             results: list[dict[str, Any]] = []
 
-            # Use the robust selector strategy found during testing
-            search_links = soup.find_all("a", attrs={"track-type": "search-result"})
-
-            for link in search_links:
-                title = link.get_text().strip()
-                href = link.get("href")
-
+            for title, link_href, full_text in search_links:
+                href = link_href
                 if not href or not title:
                     continue
 
@@ -457,25 +618,15 @@ class GcpProvider(BaseProvider):
 
                 # Try to extract description
                 description = f"Search result for {query}"
-                try:
-                    container = link.parent.parent
-                    full_text = container.get_text(" ", strip=True)
+                if full_text:
                     # Simple heuristic to get description part
                     desc_text = full_text.replace(title, "", 1).strip()
                     if desc_text:
                         description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
-                except Exception:
-                    pass
-
-                results.append(
-                    {
-                        "name": title,
-                        "description": description,
-                        "api": "",  # No API info from search
-                        "docs_url": href,
-                        "source": "cloud_google_com",
-                    }
-                )
+
+                # No API info from search
+                search_info = ServiceInfo(name=title, url=href, api="", description=description)
+                results.append(search_info.to_result("cloud_google_com"))
 
                 if len(results) >= limit:
                     break
@@ -486,6 +637,100 @@ class GcpProvider(BaseProvider):
             # Log error or just return empty? For now return empty to be safe
             return []
 
+    async def _fetch_html(self, url: str, headers: dict[str, str], max_bytes: int) -> str:
+        """
+        Stream a page, reading roughly max_bytes of raw HTML at most.
+
+        Extraction truncates its output anyway, so the rest of an oversized page is
+        never downloaded or parsed. Both parsers tolerate the cut-off markup.
+
+        Args:
+            url: Page URL
+            headers: Request headers
+            max_bytes: Raw byte budget; reading stops once it is exceeded
+
+        Returns:
+            Decoded (possibly partial) page HTML
+
+        Raises:
+            httpx.HTTPStatusError: If the page returns an error status
+        """
+        client = await self._shared_http_client()
+        async with client.stream("GET", url, headers=headers) as resp:
+            resp.raise_for_status()
+            buf = bytearray()
+            async for chunk in resp.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) > max_bytes:
+                    break
+            encoding = resp.charset_encoding or "utf-8"
+
+        try:
+            return buf.decode(encoding, errors="replace")
+        except LookupError:
+            # Unknown charset label in Content-Type
+            return buf.decode("utf-8", errors="replace")
+
+    def _extract_search_links(self, html: str) -> list[tuple[str, str | None, str | None]]:
+        """
+        Extract search result links from a cloud.google.com search page.
+
+        Args:
+            html: Search page HTML
+
+        Returns:
+            List of (title, href, container_text) tuples; container_text is the text of
+            the link's grandparent, used to derive a description, or None if unavailable
+        """
+        links: list[tuple[str, str | None, str | None]] = []
+
+        # Use the robust selector strategy found during testing
+        if use_selectolax():
+            for node in LexborHTMLParser(html).css('a[track-type="search-result"]'):
+                container = node.parent.parent if node.parent is not None else None
+                full_text = container.text(separator=" ", strip=True) if container else None
+                links.append((node.text().strip(), node.attributes.get("href"), full_text))
+            return links
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for link in soup.find_all("a", attrs={"track-type": "search-result"}):
+            container = link.parent.parent if link.parent is not None else None
+            full_text = container.get_text(" ", strip=True) if container else None
+            links.append((link.get_text().strip(), link.get("href"), full_text))
+        return links
+
+    def _extract_main_html(self, html: str) -> str | None:
+        """
+        Extract the main documentation body from a GCP docs page.
+
+        GCP docs typically use <main> or specific div classes. Navigation, sidebars,
+        scripts, and other non-content elements are removed.
+
+        Args:
+            html: Docs page HTML
+
+        Returns:
+            HTML of the main content area, or None if none was found
+        """
+        if use_selectolax():
+            tree = LexborHTMLParser(html)
+            main_node = _best_main_content(tree.css(MAIN_CONTENT_SELECTOR), lambda n: n.tag)
+            if main_node is None:
+                return None
+
+            for unwanted in main_node.css(UNWANTED_SELECTORS):
+                unwanted.decompose()
+            return main_node.html
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+        main_content = _best_main_content(soup.css.iselect(MAIN_CONTENT_SELECTOR), lambda n: n.name)
+        if main_content is None:
+            return None
+
+        for unwanted in main_content.select(UNWANTED_SELECTORS):
+            unwanted.decompose()
+        return str(main_content)
+
     async def _fetch_service_docs(self, service: str, max_bytes: int = 20480) -> dict[str, Any]:
         """
         Fetch documentation for a specific GCP service.
@@ -504,8 +749,8 @@ class GcpProvider(BaseProvider):
             # If not found in mapping, try to construct URL
             if normalized and normalized in GCP_SERVICE_DOCS:
                 service_info = GCP_SERVICE_DOCS[normalized]
-                docs_url = service_info["url"]
-                service_name = service_info["name"]
+                docs_url = service_info.url
+                service_name = service_info.name
             else:
                 # Try to search for the service
                 search_results = await self._search_services(service, limit=1)
@@ -520,67 +765,52 @@ class GcpProvider(BaseProvider):
                     docs_url = f"https://cloud.google.com/{service_slug}/docs"
                     service_name = service
 
+            # Serve previously extracted content for the same page and size budget
+            cache_key = (docs_url, max_bytes)
+            cached = self._docs_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
             # Fetch and parse HTML documentation
             headers = {"User-Agent": USER_AGENT}
-            async with await self._http_client() as client:
-                resp = await client.get(docs_url, headers=headers)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Extract main documentation content
-
-            # Try to find main content area
-            # GCP docs typically use <main> or specific div classes
-            main_content = soup.find("main")
-            if not main_content:
-                main_content = soup.find("div", class_=["devsite-article-body"])
-            if not main_content:
-                main_content = soup.find("article")
-
-            if main_content:
-                # Remove navigation, sidebar, and other non-content elements
-                for unwanted in main_content.find_all(["nav", "aside", "footer", "header"]):
-                    unwanted.decompose()
-
-                # Remove script and style tags
-                for script in main_content.find_all(["script", "style"]):
-                    script.decompose()
+            html_budget = max(max_bytes * self.DOCS_HTML_BUDGET_FACTOR, self.DOCS_HTML_MIN_BYTES)
+            page = await self._fetch_html(docs_url, headers, html_budget)
+            html_content = self._extract_main_html(page)
 
+            truncated = False
+            if html_content:
                 # Convert to markdown
-                html_content = str(main_content)
                 markdown_content = html_to_markdown(html_content, docs_url)
+                encoded = markdown_content.encode("utf-8")
+                truncated = len(encoded) > max_bytes
 
                 # Extract and prioritize sections
                 sections = extract_sections(markdown_content)
                 if sections:
-                    final_content = prioritize_sections(sections, max_bytes)
-                # No sections found, use raw content with truncation
-                elif len(markdown_content.encode("utf-8")) > max_bytes:
-                    # Simple truncation
-                    encoded = markdown_content.encode("utf-8")[:max_bytes]
-                    # Handle potential multi-byte character splits
-                    while len(encoded) > 0:
-                        try:
-                            final_content = encoded.decode("utf-8")
-                            break
-                        except UnicodeDecodeError:
-                            encoded = encoded[:-1]
-                    else:
-                        final_content = ""
+                    final_content, size_bytes = prioritize_sections_with_size(sections, max_bytes)
                 else:
-                    final_content = markdown_content
+                    # No sections found, use raw content with truncation
+                    if truncated:
+                        encoded = encoded[: utf8_cut(encoded, max_bytes)]
+                        final_content = encoded.decode("utf-8")
+                    else:
+                        final_content = markdown_content
+                    size_bytes = len(encoded)
             else:
                 # No main content found
                 final_content = f"Documentation for {service_name} is available at {docs_url}"
+                size_bytes = len(final_content.encode("utf-8"))
 
-            return {
+            result = {
                 "service": service_name,
                 "content": final_content,
-                "size_bytes": len(final_content.encode("utf-8")),
+                "size_bytes": size_bytes,
                 "source": "gcp_docs",
                 "docs_url": docs_url,
-                "truncated": len(final_content.encode("utf-8")) >= max_bytes,
+                "truncated": truncated,
             }
+            self._docs_cache.set(cache_key, result)
+            return dict(result)
 
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 404:
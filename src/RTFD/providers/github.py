@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-import base64
-from collections.abc import Callable
+import asyncio
+import binascii
+import hashlib
+import os
+import re
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 import httpx
 from mcp.types import CallToolResult
 
-from ..content_utils import convert_relative_urls
+from ..cache import TTLCache
+from ..content_utils import convert_relative_urls, utf8_cut
+from ..rate_limit import BackoffGate, retry_after_seconds
 from ..utils import (
     USER_AGENT,
     chunk_and_serialize_response,
+    get_cache_config,
     get_github_token,
     is_fetch_enabled,
     safe_json_loads,
@@ -20,37 +31,230 @@ from ..utils import (
 )
 from .base import BaseProvider, ProviderMetadata, ProviderResult, ToolTierInfo
 
+SEARCH_TOOL_NAMES = ("github_repo_search", "github_code_search")
+FETCH_TOOL_NAMES = (
+    "fetch_github_readme",
+    "list_repo_contents",
+    "get_file_content",
+    "get_repo_tree",
+    "get_repo_overview",
+    "get_commit_diff",
+    "list_github_packages",
+    "get_package_versions",
+)
+# Tool tier classification for defer_loading recommendations
+TOOL_TIERS = {
+    "github_repo_search": ToolTierInfo(tier=1, defer_recommended=False, category="search"),
+    "github_code_search": ToolTierInfo(tier=2, defer_recommended=True, category="search"),
+    "fetch_github_readme": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
+    "list_repo_contents": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
+    "get_file_content": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
+    "get_repo_tree": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
+    "get_repo_overview": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
+    "get_commit_diff": ToolTierInfo(tier=4, defer_recommended=True, category="fetch"),
+    "list_github_packages": ToolTierInfo(tier=5, defer_recommended=True, category="fetch"),
+    "get_package_versions": ToolTierInfo(tier=5, defer_recommended=True, category="fetch"),
+}
+
+# Leading bytes sniffed for a NUL, the same window git uses to call a file binary
+BINARY_SNIFF_BYTES = 8000
+
+# "owner/repo" with exactly one slash and no whitespace in either segment
+_REPO_RE = re.compile(r"([^/\s]+)/([^/\s]+)")
+INVALID_REPO_ERROR = "Invalid repo format. Use 'owner/repo'"
+# Search operators must stay uppercase in a GitHub search query
+_SEARCH_OPERATORS = frozenset({"AND", "OR", "NOT"})
+# One search term: runs of non-space text and "quoted phrases" (spaces kept inside)
+_SEARCH_TERM_RE = re.compile(r'(?:[^\s"]+|"[^"]*"?)+')
+GITHUB_API = "https://api.github.com"
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """A cached GitHub JSON payload with the validators needed to revalidate it."""
+
+    fresh_until: float  # time.monotonic() deadline for serving without a request
+    etag: str | None
+    last_modified: str | None
+    data: Any
+
+
+def _rate_limit_resource(url: str) -> str:
+    """
+    Name the GitHub rate limit a request URL counts against.
+
+    GitHub budgets code search, other searches, and the rest of the REST API
+    separately (X-RateLimit-Resource), and raw.githubusercontent.com is outside
+    them all, so one exhausted budget should not stall requests drawing on another.
+    """
+    if not url.startswith(f"{GITHUB_API}/"):
+        return "raw"
+    if url.startswith(f"{GITHUB_API}/search/code"):
+        return "code_search"
+    if url.startswith(f"{GITHUB_API}/search/"):
+        return "search"
+    return "core"
+
+
+def _normalize_search_query(query: str) -> str:
+    """
+    Canonicalize a search query so equivalent spellings share a cache entry.
+
+    GitHub matches search terms regardless of case and spacing, so "FastAPI" and
+    " fastapi " return the same results. The AND/OR/NOT operators, qualifiers
+    such as language:Python, and quoted phrases (including their inner spacing)
+    are left as written.
+    """
+    return " ".join(
+        term if term in _SEARCH_OPERATORS or ":" in term or '"' in term else term.lower()
+        for term in _SEARCH_TERM_RE.findall(query)
+    )
+
+
+def _parse_repo(repo: str) -> tuple[str, str] | None:
+    """
+    Split an "owner/repo" tool argument.
+
+    Returns:
+        Tuple of (owner, repo_name), or None if either part is missing, contains
+        whitespace, or is followed by extra path segments
+    """
+    m = _REPO_RE.fullmatch(repo)
+    return m.groups() if m else None
+
+
+def _invalid_repo_result(repo: str, **fields: Any) -> CallToolResult:
+    """Build the error result for a malformed "owner/repo" argument."""
+    return serialize_response_with_meta({"repository": repo, **fields, "error": INVALID_REPO_ERROR})
+
+
+async def _run_repo_tool(
+    repo: str,
+    error_fields: dict[str, Any],
+    fetch: Callable[[str, str], Awaitable[dict[str, Any]]],
+    serialize: Callable[[Any], CallToolResult] = serialize_response_with_meta,
+) -> CallToolResult:
+    """
+    Run a GitHub tool that takes an "owner/repo" argument.
+
+    Args:
+        repo: Tool argument in "owner/repo" form
+        error_fields: Empty result fields to include if repo is malformed
+        fetch: Called with (owner, repo_name) to produce the result
+        serialize: Result serializer (chunk_and_serialize_response for large docs)
+
+    Returns:
+        Serialized result, or the invalid-repo error
+    """
+    parsed = _parse_repo(repo)
+    if parsed is None:
+        return _invalid_repo_result(repo, **error_fields)
+    return serialize(await fetch(*parsed))
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Compute a file's git blob SHA-1, as ``git hash-object`` would."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data, usedforsecurity=False).hexdigest()
+
+
+def _decode_base64_prefix(encoded: str, max_bytes: int) -> bytes:
+    """
+    Decode at least max_bytes + 1 bytes of base64 text, or all of it if shorter.
+
+    Inline API content can be up to 1MB, so only the prefix that can survive
+    truncation is decoded. The extra byte lets callers tell whether they cut.
+    """
+    needed = (max_bytes // 3 + 1) * 4  # Characters encoding more than max_bytes
+    # Slack for the API's line breaks; a denser layout falls back to a full decode
+    prefix = "".join(encoded[: needed + needed // 32 + 4].split())
+    if len(prefix) < needed:
+        return binascii.a2b_base64(encoded)
+    return binascii.a2b_base64(prefix[:needed])
+
+
+def _decode_text_bytes(raw: bytes | bytearray) -> str | None:
+    """
+    Decode raw file bytes as UTF-8 text.
+
+    Returns:
+        Decoded text, or None if the file appears to be binary
+    """
+    if b"\x00" in raw[:BINARY_SNIFF_BYTES]:
+        return None
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _truncate_utf8(content: str, max_bytes: int) -> tuple[str, int, bool]:
+    """
+    Truncate text to at most max_bytes of UTF-8 without splitting a character.
+
+    The text is encoded once; the cut point comes from utf8_cut, so the byte size
+    is known without re-encoding the result.
+
+    Returns:
+        Tuple of (text, size_bytes, truncated)
+    """
+    encoded = content.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return content, len(encoded), False
+
+    cut = utf8_cut(encoded, max_bytes)
+    return encoded[:cut].decode("utf-8"), cut, True
+
 
 class GitHubProvider(BaseProvider):
     """Provider for GitHub repository and code search."""
 
-    def get_metadata(self) -> ProviderMetadata:
-        tool_names = ["github_repo_search", "github_code_search"]
-        if is_fetch_enabled():
-            tool_names.extend(
-                [
-                    "fetch_github_readme",
-                    "list_repo_contents",
-                    "get_file_content",
-                    "get_repo_tree",
-                    "get_commit_diff",
-                    "list_github_packages",
-                    "get_package_versions",
-                ]
+    DEFAULT_MAX_CONCURRENCY = 10  # Simultaneous requests, override with GITHUB_MAX_CONCURRENCY
+    RATE_LIMIT_MAX_WAIT = 30.0  # Longest rate-limit reset worth waiting out in one call
+    MAX_BATCH_FILES = 20  # Paths accepted by one get_file_content call
+    RESPONSE_CACHE_SIZE = 512  # Distinct GET requests kept in memory
+    RESPONSE_CACHE_TTL = 300.0  # Serve cached payloads without asking GitHub
+    RESPONSE_REVALIDATE_TTL = 3600.0  # Keep stale payloads around for ETag revalidation
+    RAW_CACHE_SIZE = 32  # Raw files and diffs (up to max_bytes each) kept for revalidation
+    RAW_HOST_MISS_SIZE = 256  # Repos remembered as not served by raw.githubusercontent.com
+    RAW_HOST_MISS_TTL = 3600.0  # Retry the raw host for such a repo after this long
+
+    def __init__(self, http_client_factory: Callable):
+        """Initialize provider with HTTP client factory, concurrency cap, and response cache."""
+        super().__init__(http_client_factory)
+        try:
+            max_concurrency = int(
+                os.getenv("GITHUB_MAX_CONCURRENCY", str(self.DEFAULT_MAX_CONCURRENCY))
             )
+        except ValueError:
+            max_concurrency = self.DEFAULT_MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        # Shared pauses keyed by _rate_limit_resource()
+        self._backoff: defaultdict[str, BackoffGate] = defaultdict(BackoffGate)
+
+        cache_enabled, _ = get_cache_config()
+        self._response_cache = TTLCache(
+            maxsize=self.RESPONSE_CACHE_SIZE if cache_enabled else 0,
+            ttl=self.RESPONSE_REVALIDATE_TTL,
+        )
+        self._raw_cache = TTLCache(
+            maxsize=self.RAW_CACHE_SIZE if cache_enabled else 0,
+            ttl=self.RESPONSE_REVALIDATE_TTL,
+        )
+        self._inflight_requests: dict[tuple[Any, ...], asyncio.Future] = {}
+        # (GITHUB_AUTH, GITHUB_TOKEN) the cached headers were built for, and the
+        # headers built for it keyed by Accept type
+        self._headers: tuple[tuple[str | None, str | None], dict[str, dict[str, str]]] | None = None
+        # Repos whose files raw.githubusercontent.com would not serve
+        self._raw_host_misses = TTLCache(
+            maxsize=self.RAW_HOST_MISS_SIZE, ttl=self.RAW_HOST_MISS_TTL
+        )
+        # get_tools() results keyed by is_fetch_enabled()
+        self._tools: dict[bool, dict[str, Callable]] = {}
 
-        # Tool tier classification for defer_loading recommendations
-        tool_tiers = {
-            "github_repo_search": ToolTierInfo(tier=1, defer_recommended=False, category="search"),
-            "github_code_search": ToolTierInfo(tier=2, defer_recommended=True, category="search"),
-            "fetch_github_readme": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
-            "list_repo_contents": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
-            "get_file_content": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
-            "get_repo_tree": ToolTierInfo(tier=3, defer_recommended=True, category="fetch"),
-            "get_commit_diff": ToolTierInfo(tier=4, defer_recommended=True, category="fetch"),
-            "list_github_packages": ToolTierInfo(tier=5, defer_recommended=True, category="fetch"),
-            "get_package_versions": ToolTierInfo(tier=5, defer_recommended=True, category="fetch"),
-        }
+    def get_metadata(self) -> ProviderMetadata:
+        tool_names = list(SEARCH_TOOL_NAMES)
+        if is_fetch_enabled():
+            tool_names.extend(FETCH_TOOL_NAMES)
 
         return ProviderMetadata(
             name="github",
@@ -59,8 +263,8 @@ class GitHubProvider(BaseProvider):
             tool_names=tool_names,
             supports_library_search=True,
             required_env_vars=[],
-            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH"],
-            tool_tiers=tool_tiers,
+            optional_env_vars=["GITHUB_TOKEN", "GITHUB_AUTH", "GITHUB_MAX_CONCURRENCY"],
+            tool_tiers=dict(TOOL_TIERS),
         )
 
     async def search_library(self, library: str, limit: int = 5) -> ProviderResult:
@@ -77,84 +281,294 @@ class GitHubProvider(BaseProvider):
             error_msg = f"GitHub request failed: {exc}"
             return ProviderResult(success=False, error=error_msg, provider_name="github")
 
+    async def _get_json(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, str] | None = None,
+        *,
+        allow_not_found: bool = False,
+    ) -> Any:
+        """
+        GET a GitHub API JSON resource through the in-memory response cache.
+
+        Fresh entries are returned without a request. Stale entries are revalidated
+        with If-None-Match / If-Modified-Since, so an unchanged resource costs a 304
+        instead of a full payload. Identical concurrent requests share one in-flight
+        fetch.
+
+        Args:
+            url: API URL
+            headers: Request headers (Accept and Authorization are part of the key)
+            params: Optional query parameters
+            allow_not_found: Return None for a 404 instead of raising, for probes
+                where a missing resource is an expected outcome
+
+        Returns:
+            Parsed JSON payload (shared with the cache; callers must not mutate it)
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub returns an error status
+        """
+        key = self._response_key(url, headers, params)
+        entry = self._response_cache.get(key)
+        if entry is not None and entry.fresh_until > time.monotonic():
+            return entry.data
+
+        inflight_key = (key, allow_not_found)
+        task = self._inflight_requests.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_json(url, headers, params, entry, allow_not_found)
+            )
+            self._inflight_requests[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight_requests.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+    def _rate_limit_delay(self, resp: httpx.Response) -> float | None:
+        """
+        Get how long to wait before retrying a rate-limited response.
+
+        Secondary rate limits carry Retry-After; an exhausted primary quota carries
+        X-RateLimit-Remaining: 0 and an X-RateLimit-Reset epoch.
+
+        Returns:
+            Delay in seconds, or None if the response is not retryable
+        """
+        if resp.status_code not in (403, 429):
+            return None
+        if "Retry-After" in resp.headers:
+            return retry_after_seconds(resp, maximum=self.RATE_LIMIT_MAX_WAIT)
+        return self._quota_reset_delay(resp)
+
+    def _quota_reset_delay(self, resp: httpx.Response) -> float | None:
+        """Get the wait until an exhausted quota resets, if within RATE_LIMIT_MAX_WAIT."""
+        if resp.headers.get("X-RateLimit-Remaining") != "0":
+            return None
+        try:
+            delay = float(resp.headers["X-RateLimit-Reset"]) - time.time()
+        except (KeyError, ValueError):
+            return None
+        return max(delay, 0.0) if delay <= self.RATE_LIMIT_MAX_WAIT else None
+
+    def _observe_rate_limit(self, resp: httpx.Response, gate: BackoffGate) -> bool:
+        """
+        Pause requests sharing gate if a response throttled or used up the quota.
+
+        Returns:
+            True if resp was rate limited and is worth retrying after the pause
+        """
+        delay = self._rate_limit_delay(resp)
+        if delay is not None:
+            gate.pause(delay)
+            return True
+        # The request that spent the last token succeeded; hold the next ones
+        delay = self._quota_reset_delay(resp)
+        if delay is not None:
+            gate.pause(delay)
+        return False
+
+    async def _github_get(
+        self, client: httpx.AsyncClient, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        GET a GitHub API URL with bounded concurrency.
+
+        Requests wait at the backoff gate of their rate-limit resource, so one
+        throttled response pauses the others drawing on the same budget. A
+        rate-limited response is retried once after its advertised delay.
+        """
+        gate = self._backoff[_rate_limit_resource(url)]
+        async with self._semaphore:
+            await gate.wait()
+            resp = await client.get(url, **kwargs)
+            if self._observe_rate_limit(resp, gate):
+                await gate.wait()
+                resp = await client.get(url, **kwargs)
+                self._observe_rate_limit(resp, gate)
+            return resp
+
+    @staticmethod
+    def _response_key(
+        url: str, headers: dict[str, str], params: dict[str, str] | None
+    ) -> tuple[Any, ...]:
+        """Build the response cache key; responses for different tokens never mix."""
+        return (
+            url,
+            tuple(sorted((params or {}).items())),
+            headers.get("Accept"),
+            headers.get("Authorization"),
+        )
+
+    @staticmethod
+    def _conditional_headers(
+        headers: dict[str, str], stale: _CachedResponse | None
+    ) -> dict[str, str]:
+        """Add If-None-Match / If-Modified-Since validators from a stale cache entry."""
+        if stale is None or not (stale.etag or stale.last_modified):
+            return headers
+        conditional = dict(headers)
+        if stale.etag:
+            conditional["If-None-Match"] = stale.etag
+        if stale.last_modified:
+            conditional["If-Modified-Since"] = stale.last_modified
+        return conditional
+
+    async def _fetch_json(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, str] | None,
+        stale: _CachedResponse | None,
+        allow_not_found: bool = False,
+    ) -> Any:
+        """
+        Fetch a JSON resource, revalidating a stale cache entry when one exists.
+
+        Args:
+            url: API URL
+            headers: Request headers
+            params: Optional query parameters
+            stale: Expired cache entry to revalidate, if any
+            allow_not_found: Return None for a 404 instead of raising
+
+        Returns:
+            Parsed JSON payload, or None for an allowed 404
+        """
+        key = self._response_key(url, headers, params)
+        conditional = self._conditional_headers(headers, stale)
+
+        client = await self._shared_http_client()
+        resp = await self._github_get(client, url, params=params, headers=conditional)
+        if resp.status_code == 304 and stale is None:
+            # Not Modified without a stored body to reuse; ask again unconditionally
+            resp = await self._github_get(client, url, params=params, headers=headers)
+
+        if resp.status_code == 304 and stale is not None:
+            data = stale.data
+            etag = resp.headers.get("ETag", stale.etag)
+            last_modified = resp.headers.get("Last-Modified", stale.last_modified)
+        elif resp.status_code == 404 and allow_not_found:
+            # Checked before raise_for_status() so expected misses build no exception
+            self._response_cache.invalidate(key)
+            return None
+        else:
+            resp.raise_for_status()
+            # Parsed inline even for multi-MB trees: orjson and the stdlib scanner hold
+            # the GIL for the whole parse, so asyncio.to_thread would not free the loop
+            data = safe_json_loads(resp.content)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+
+        self._response_cache.set(
+            key,
+            _CachedResponse(
+                fresh_until=time.monotonic() + self.RESPONSE_CACHE_TTL,
+                etag=etag,
+                last_modified=last_modified,
+                data=data,
+            ),
+        )
+        return data
+
     async def _search_repos(
         self, query: str, limit: int = 5, language: str | None = "Python"
     ) -> list[dict[str, Any]]:
         """Query GitHub's repository search API."""
         headers = self._get_headers()
 
-        params = {"q": query, "per_page": str(limit)}
+        query = _normalize_search_query(query)
         if language:
-            params["q"] = f"{query} language:{language}"
+            query = f"{query} language:{language}"
+        params = {"q": query, "per_page": str(limit)}
 
-        async with await self._http_client() as client:
-            resp = await client.get(
-                "https://api.github.com/search/repositories",
-                params=params,
-                headers=headers,
-            )
-            resp.raise_for_status()
-            payload = safe_json_loads(resp.text)
+        payload = await self._get_json(f"{GITHUB_API}/search/repositories", headers, params)
 
-        repos: list[dict[str, Any]] = []
-        for item in payload.get("items", []):
-            repos.append(
-                {
-                    "name": item.get("full_name"),
-                    "description": item.get("description") or "",
-                    "stars": item.get("stargazers_count", 0),
-                    "url": item.get("html_url"),
-                    "default_branch": item.get("default_branch"),
-                }
-            )
-            if len(repos) >= limit:
-                break
-        return repos
+        return [
+            {
+                "name": item.get("full_name"),
+                "description": item.get("description") or "",
+                "stars": item.get("stargazers_count", 0),
+                "url": item.get("html_url"),
+                "default_branch": item.get("default_branch"),
+            }
+            for item in islice(payload.get("items") or (), max(limit, 1))
+        ]
 
     async def _search_code(
-        self, query: str, repo: str | None = None, limit: int = 5
+        self,
+        query: str,
+        repo: str | None = None,
+        limit: int = 5,
+        *,
+        path: str | None = None,
+        language: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Search code on GitHub; optionally scoping to a repository."""
-        headers = self._get_headers()
+        """
+        Search code on GitHub; optionally scoping to a repository.
+
+        The scope arguments become search qualifiers, so GitHub filters candidates
+        server-side instead of returning files the caller would discard. Hits carry
+        the matched snippets (text-match media type), which often answers the query
+        without a follow-up file fetch.
+        """
+        headers = self._get_headers("application/vnd.github.text-match+json")
 
-        search_query = query
-        if repo:
-            search_query = f"{query} repo:{repo}"
+        qualifiers = (
+            f"repo:{repo}" if repo else None,
+            f"path:{path}" if path else None,
+            f"language:{language}" if language else None,
+        )
+        search_query = " ".join(filter(None, (_normalize_search_query(query), *qualifiers)))
 
         params = {"q": search_query, "per_page": str(limit)}
-        async with await self._http_client() as client:
-            resp = await client.get(
-                "https://api.github.com/search/code",
-                params=params,
-                headers=headers,
-            )
-            resp.raise_for_status()
-            payload = safe_json_loads(resp.text)
+        payload = await self._get_json(f"{GITHUB_API}/search/code", headers, params)
+
+        return [
+            {
+                "name": item.get("name"),
+                "path": item.get("path"),
+                "repository": item.get("repository", {}).get("full_name"),
+                "url": item.get("html_url"),
+                "fragments": [
+                    match.get("fragment", "") for match in item.get("text_matches") or ()
+                ],
+            }
+            for item in islice(payload.get("items") or (), max(limit, 1))
+        ]
 
-        code_hits: list[dict[str, Any]] = []
-        for item in payload.get("items", []):
-            code_hits.append(
-                {
-                    "name": item.get("name"),
-                    "path": item.get("path"),
-                    "repository": item.get("repository", {}).get("full_name"),
-                    "url": item.get("html_url"),
-                }
-            )
-            if len(code_hits) >= limit:
-                break
-        return code_hits
-
-    def _get_headers(self) -> dict[str, str]:
-        """Build GitHub API headers with optional auth token."""
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
-        token = get_github_token()
-        if token:
-            headers["Authorization"] = f"token {token}"
+    def _get_headers(self, accept: str = "application/vnd.github+json") -> dict[str, str]:
+        """
+        Build GitHub API headers with optional auth token.
+
+        Headers are cached per GITHUB_AUTH/GITHUB_TOKEN setting and Accept type, so the
+        token lookup (which may shell out to the gh CLI) only reruns when that
+        configuration changes. The returned dict is shared and must not be mutated.
+
+        Args:
+            accept: Media type to request (default: GitHub JSON)
+        """
+        auth_config = (os.getenv("GITHUB_AUTH"), os.getenv("GITHUB_TOKEN"))
+        if self._headers is None or self._headers[0] != auth_config:
+            self._headers = (auth_config, {})
+        variants = self._headers[1]
+        headers = variants.get(accept)
+        if headers is not None:
+            return headers
+
+        if variants:
+            base = next(iter(variants.values()))
+            headers = {**base, "Accept": accept}
+        else:
+            headers = {
+                "User-Agent": USER_AGENT,
+                "Accept": accept,
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+            token = get_github_token()
+            if token:
+                headers["Authorization"] = f"token {token}"
+        variants[accept] = headers
         return headers
 
     async def _fetch_github_readme(
@@ -173,49 +587,46 @@ class GitHubProvider(BaseProvider):
         """
         try:
             headers = self._get_headers()
-            url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+            url = f"{GITHUB_API}/repos/{owner}/{repo}/readme"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
+            data = await self._get_json(url, headers)
 
-            # Decode base64 content
-            content = base64.b64decode(data["content"]).decode("utf-8")
+            if data.get("encoding") != "base64" and data.get("download_url"):
+                # READMEs over 1MB come without inline content (encoding "none"); read
+                # just max_bytes raw
+                entry = await self._fetch_raw(data["download_url"], headers, max_bytes)
+                raw, raw_truncated, _ = entry.data
+            else:
+                # Cut before decoding so only max_bytes is decoded and URL-rewritten
+                raw = _decode_base64_prefix(data["content"], max_bytes)
+                raw_truncated = len(raw) > max_bytes
+                raw = raw[: utf8_cut(raw, max_bytes)]
+            content = raw.decode("utf-8")
 
             # Convert relative URLs to absolute
-            # Use the blob URL for the specific branch/path
-            data.get("name", "README.md")
+            # Resolve against the README's own directory on the branch GitHub served it
+            # from; without html_url, fall back to the HEAD alias of the default branch
             readme_path = data.get("path", "")
-            default_branch = "main"  # Could be fetched from repo metadata if needed
-
-            base_url = f"https://github.com/{owner}/{repo}/blob/{default_branch}"
-            if readme_path and "/" in readme_path:
-                # If README is in a subdirectory
-                dir_path = "/".join(readme_path.split("/")[:-1])
-                base_url = f"{base_url}/{dir_path}"
+            html_url = data.get("html_url")
+            if html_url:
+                base_url = html_url.rsplit("/", 1)[0]
+            else:
+                base_url = f"https://github.com/{owner}/{repo}/blob/HEAD"
+                if readme_path and "/" in readme_path:
+                    # If README is in a subdirectory
+                    dir_path = "/".join(readme_path.split("/")[:-1])
+                    base_url = f"{base_url}/{dir_path}"
 
             content = convert_relative_urls(content, base_url)
 
-            # Truncate if needed
-            if len(content.encode("utf-8")) > max_bytes:
-                # Simple truncation for now - could use smart_truncate
-                encoded = content.encode("utf-8")[:max_bytes]
-                # Handle potential multi-byte character splits
-                while len(encoded) > 0:
-                    try:
-                        content = encoded.decode("utf-8")
-                        break
-                    except UnicodeDecodeError:
-                        encoded = encoded[:-1]
-                truncated = True
-            else:
-                truncated = False
+            # Rewritten links can push the text back over max_bytes
+            content, size_bytes, truncated = _truncate_utf8(content, max_bytes)
+            truncated = truncated or raw_truncated
 
             return {
                 "repository": f"{owner}/{repo}",
                 "content": content,
-                "size_bytes": len(content.encode("utf-8")),
+                "size_bytes": size_bytes,
                 "source": "github_readme",
                 "readme_path": readme_path,
                 "truncated": truncated,
@@ -252,12 +663,9 @@ class GitHubProvider(BaseProvider):
         """
         try:
             headers = self._get_headers()
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
+            url = f"{GITHUB_API}/repos/{owner}/{repo}/contents/{path}"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
+            data = await self._get_json(url, headers)
 
             # Handle single file vs directory
             if isinstance(data, dict):
@@ -266,19 +674,18 @@ class GitHubProvider(BaseProvider):
             else:
                 items = data
 
-            contents = []
-            for item in items:
-                contents.append(
-                    {
-                        "name": item.get("name"),
-                        "path": item.get("path"),
-                        "type": item.get("type"),  # "file" or "dir"
-                        "size": item.get("size"),
-                        "sha": item.get("sha"),
-                        "url": item.get("html_url"),
-                        "download_url": item.get("download_url"),
-                    }
-                )
+            contents = [
+                {
+                    "name": item.get("name"),
+                    "path": item.get("path"),
+                    "type": item.get("type"),  # "file" or "dir"
+                    "size": item.get("size"),
+                    "sha": item.get("sha"),
+                    "url": item.get("html_url"),
+                    "download_url": item.get("download_url"),
+                }
+                for item in items
+            ]
 
             return {
                 "repository": f"{owner}/{repo}",
@@ -308,6 +715,11 @@ class GitHubProvider(BaseProvider):
         """
         Get content of a specific file from a GitHub repository.
 
+        Files are read raw, so the contents API's sha and html_url are not available.
+        sha is the git blob SHA computed from the bytes (None when the file was
+        truncated), and url links the path on the default branch (blob/HEAD), so it
+        follows that branch rather than pinning the revision that was read.
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -317,58 +729,53 @@ class GitHubProvider(BaseProvider):
         Returns:
             Dict with file content and metadata
         """
-        try:
-            headers = self._get_headers()
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
+        if not path or path.startswith("/") or ".." in path.split("/"):
+            # Rejected locally; such a request could only fail or list the repo root
+            return {
+                "repository": f"{owner}/{repo}",
+                "path": path,
+                "content": "",
+                "error": "Invalid path. Use a repository-relative file path",
+            }
 
-            # Check if it's a file
-            if data.get("type") != "file":
+        try:
+            entry = await self._fetch_file_entry(owner, repo, path, max_bytes)
+            raw, truncated, content_type = entry.data
+
+            if content_type.startswith("application/json"):
+                # Directories and submodules come back as JSON metadata instead
+                try:
+                    meta = safe_json_loads(raw)
+                except ValueError:
+                    meta = None
+                kind = meta.get("type") if isinstance(meta, dict) else "dir"
                 return {
                     "repository": f"{owner}/{repo}",
                     "path": path,
                     "content": "",
-                    "error": f"Path is a {data.get('type')}, not a file",
+                    "error": f"Path is a {kind}, not a file",
                 }
 
-            # Decode base64 content
-            try:
-                content = base64.b64decode(data["content"]).decode("utf-8")
-            except UnicodeDecodeError:
-                # Binary file
+            content = _decode_text_bytes(raw)
+            if content is None:
                 return {
                     "repository": f"{owner}/{repo}",
                     "path": path,
                     "content": "",
                     "error": "File appears to be binary",
-                    "size_bytes": data.get("size", 0),
-                    "encoding": data.get("encoding"),
+                    "size_bytes": len(raw),
+                    "truncated": truncated,
                 }
 
-            # Truncate if needed
-            truncated = False
-            if len(content.encode("utf-8")) > max_bytes:
-                encoded = content.encode("utf-8")[:max_bytes]
-                while len(encoded) > 0:
-                    try:
-                        content = encoded.decode("utf-8")
-                        break
-                    except UnicodeDecodeError:
-                        encoded = encoded[:-1]
-                truncated = True
-
             return {
                 "repository": f"{owner}/{repo}",
                 "path": path,
                 "content": content,
-                "size_bytes": len(content.encode("utf-8")),
+                "size_bytes": len(raw),
                 "truncated": truncated,
-                "sha": data.get("sha"),
-                "url": data.get("html_url"),
+                # Raw responses carry neither sha nor html_url; both are derived
+                "sha": None if truncated else _git_blob_sha(raw),
+                "url": f"https://github.com/{owner}/{repo}/blob/HEAD/{path}",
             }
 
         except httpx.HTTPStatusError as exc:
@@ -386,6 +793,60 @@ class GitHubProvider(BaseProvider):
                 "error": f"Failed to get file content: {exc!s}",
             }
 
+    async def _fetch_file_entry(
+        self, owner: str, repo: str, path: str, max_bytes: int
+    ) -> _CachedResponse:
+        """
+        Stream a file from raw.githubusercontent.com, falling back to the contents API.
+
+        The raw host is CDN-cached and not counted against the API rate limit. It
+        resolves HEAD to the default branch itself, so no ref lookup is needed.
+        Directories, submodules, and repos it will not serve (e.g. private ones
+        without a token) fall back to the API's raw media type; repos where only
+        the API worked skip the raw host for RAW_HOST_MISS_TTL.
+        """
+        if self._raw_host_misses.get((owner, repo)) is None:
+            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/HEAD/{path}"
+            try:
+                return await self._fetch_raw(raw_url, self._get_headers(), max_bytes)
+            except httpx.HTTPStatusError:
+                pass
+
+        # Raw media type, streamed, so only about max_bytes of the file is read
+        api_headers = self._get_headers("application/vnd.github.raw")
+        url = f"{GITHUB_API}/repos/{owner}/{repo}/contents/{path}"
+        entry = await self._fetch_raw(url, api_headers, max_bytes)
+        if not entry.data[2].startswith("application/json"):
+            self._raw_host_misses.set((owner, repo), True)
+        return entry
+
+    async def _get_file_contents(
+        self, owner: str, repo: str, paths: list[str], max_bytes: int = 102400
+    ) -> dict[str, Any]:
+        """
+        Get the content of several files concurrently.
+
+        Requests are bounded by the provider's concurrency limit; each file is
+        fetched, truncated, and reported exactly as by _get_file_content. A path
+        repeated in the list is fetched once.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            paths: Paths to files
+            max_bytes: Maximum content size per file (default 100KB)
+
+        Returns:
+            Dict with per-file results in request order
+        """
+        unique = list(dict.fromkeys(paths))
+        results = await asyncio.gather(
+            *(self._get_file_content(owner, repo, path, max_bytes) for path in unique)
+        )
+        by_path = dict(zip(unique, results, strict=True))
+        files = [by_path[path] for path in paths]
+        return {"repository": f"{owner}/{repo}", "files": files, "count": len(files)}
+
     async def _get_repo_tree(
         self, owner: str, repo: str, recursive: bool = False, max_items: int = 1000
     ) -> dict[str, Any]:
@@ -404,44 +865,47 @@ class GitHubProvider(BaseProvider):
         try:
             headers = self._get_headers()
 
-            # First get the default branch
-            repo_url = f"https://api.github.com/repos/{owner}/{repo}"
-            async with await self._http_client() as client:
-                repo_resp = await client.get(repo_url, headers=headers)
-                repo_resp.raise_for_status()
-                repo_data = safe_json_loads(repo_resp.text)
-                default_branch = repo_data.get("default_branch", "main")
-
-            # Get the tree
-            tree_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{default_branch}"
-            if recursive:
-                tree_url += "?recursive=1"
-
-            async with await self._http_client() as client:
-                resp = await client.get(tree_url, headers=headers)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
-
-            tree_items = data.get("tree", [])[:max_items]
-
-            tree = []
-            for item in tree_items:
-                tree.append(
-                    {
-                        "path": item.get("path"),
-                        "type": item.get("type"),  # "blob" (file) or "tree" (dir)
-                        "size": item.get("size"),
-                        "sha": item.get("sha"),
-                        "url": item.get("url"),
-                    }
-                )
+            repo_url = f"{GITHUB_API}/repos/{owner}/{repo}"
+            trees_url = f"{GITHUB_API}/repos/{owner}/{repo}/git/trees"
+            suffix = "?recursive=1" if recursive else ""
+
+            # Fetch the repo metadata (for the default branch name) and the HEAD tree,
+            # which GitHub resolves to the default branch, in one round trip
+            repo_data, data = await asyncio.gather(
+                self._get_json(repo_url, headers),
+                self._get_json(f"{trees_url}/HEAD{suffix}", headers),
+                return_exceptions=True,
+            )
+            if isinstance(repo_data, BaseException):
+                raise repo_data
+            default_branch = repo_data.get("default_branch", "main")
+
+            if isinstance(data, httpx.HTTPStatusError) and data.response.status_code in (404, 422):
+                # HEAD is not resolvable on some repos; ask for the branch explicitly
+                data = await self._get_json(f"{trees_url}/{default_branch}{suffix}", headers)
+            elif isinstance(data, BaseException):
+                raise data
+
+            all_items = data.get("tree") or []
+            truncated = data.get("truncated", False) or len(all_items) > max_items
+
+            tree = [
+                {
+                    "path": item.get("path"),
+                    "type": item.get("type"),  # "blob" (file) or "tree" (dir)
+                    "size": item.get("size"),
+                    "sha": item.get("sha"),
+                    "url": item.get("url"),
+                }
+                for item in islice(all_items, max_items)
+            ]
 
             return {
                 "repository": f"{owner}/{repo}",
                 "branch": default_branch,
                 "tree": tree,
                 "count": len(tree),
-                "truncated": data.get("truncated", False) or len(tree_items) >= max_items,
+                "truncated": truncated,
             }
 
         except httpx.HTTPStatusError as exc:
@@ -457,37 +921,200 @@ class GitHubProvider(BaseProvider):
                 "error": f"Failed to get repository tree: {exc!s}",
             }
 
-    async def _get_commit_diff(self, owner: str, repo: str, base: str, head: str) -> dict[str, Any]:
+    async def _get_repo_overview(
+        self, owner: str, repo: str, max_bytes: int = 20480
+    ) -> dict[str, Any]:
+        """
+        Get a repository's description, README, and top-level files in one call.
+
+        The three lookups run concurrently. The repo metadata request is shared with
+        the one _get_repo_tree makes, so the overview costs no more requests than
+        fetching the README and the tree separately.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            max_bytes: Maximum README size
+
+        Returns:
+            Dict with repository metadata, README text, and the root tree
+        """
+        try:
+            headers = self._get_headers()
+            repo_url = f"{GITHUB_API}/repos/{owner}/{repo}"
+
+            meta, readme, tree = await asyncio.gather(
+                self._get_json(repo_url, headers),
+                self._fetch_github_readme(owner, repo, max_bytes),
+                self._get_repo_tree(owner, repo),
+            )
+
+            result = {
+                "repository": f"{owner}/{repo}",
+                "description": meta.get("description") or "",
+                "stars": meta.get("stargazers_count", 0),
+                "default_branch": meta.get("default_branch"),
+                "readme": readme.get("content", ""),
+                "readme_path": readme.get("readme_path"),
+                "readme_truncated": readme.get("truncated", False),
+                "tree": tree.get("tree", []),
+                "tree_truncated": tree.get("truncated", False),
+            }
+            # A repo without a README (or an oversized tree) still has an overview
+            if "error" in readme:
+                result["readme_error"] = readme["error"]
+            if "error" in tree:
+                result["tree_error"] = tree["error"]
+            return result
+
+        except httpx.HTTPStatusError as exc:
+            return {
+                "repository": f"{owner}/{repo}",
+                "readme": "",
+                "tree": [],
+                "error": f"GitHub returned {exc.response.status_code}",
+            }
+        except Exception as exc:
+            return {
+                "repository": f"{owner}/{repo}",
+                "readme": "",
+                "tree": [],
+                "error": f"Failed to get repo overview: {exc!s}",
+            }
+
+    async def _stream_limited(
+        self, url: str, headers: dict[str, str], max_bytes: int
+    ) -> tuple[bytearray, bool, httpx.Response]:
+        """
+        Stream a response body, reading little more than max_bytes of it.
+
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            max_bytes: Maximum number of bytes to keep
+
+        Returns:
+            Tuple of (body cut on a UTF-8 character boundary, truncated, response).
+            The closed response gives access to the status and headers; a 304 reply
+            to a conditional request comes back with an empty body.
+
+        Raises:
+            httpx.HTTPStatusError: If the request returns an error status
+        """
+        client = await self._shared_http_client()
+        gate = self._backoff[_rate_limit_resource(url)]
+        async with self._semaphore:
+            await gate.wait()
+            raw, resp = await self._read_limited(client, url, headers, max_bytes)
+            if self._observe_rate_limit(resp, gate):
+                await gate.wait()
+                raw, resp = await self._read_limited(client, url, headers, max_bytes)
+                self._observe_rate_limit(resp, gate)
+        if resp.status_code != 304:
+            resp.raise_for_status()
+
+        truncated = len(raw) > max_bytes
+        if truncated:
+            del raw[utf8_cut(raw, max_bytes) :]
+        return raw, truncated, resp
+
+    @staticmethod
+    async def _read_limited(
+        client: httpx.AsyncClient, url: str, headers: dict[str, str], max_bytes: int
+    ) -> tuple[bytearray, httpx.Response]:
+        """Read a streamed body until it passes max_bytes, then close the stream."""
+        async with client.stream("GET", url, headers=headers) as resp:
+            raw = bytearray()
+            if resp.is_success:
+                async for chunk in resp.aiter_bytes(65536):
+                    raw.extend(chunk)
+                    if len(raw) > max_bytes:
+                        break
+        return raw, resp
+
+    async def _fetch_raw(
+        self, url: str, headers: dict[str, str], max_bytes: int
+    ) -> _CachedResponse:
+        """
+        Stream a raw (non-JSON) resource, revalidating a cached copy when stale.
+
+        Files and compare ranges rarely change between calls, so a repeated read
+        usually costs a 304 instead of re-downloading the body.
+
+        Returns:
+            Cache entry whose data is (body bytes, truncated, Content-Type)
+        """
+        key = (self._response_key(url, headers, None), max_bytes)
+        entry = self._raw_cache.get(key)
+        if entry is not None and entry.fresh_until > time.monotonic():
+            return entry
+
+        conditional = self._conditional_headers(headers, entry)
+        raw, truncated, resp = await self._stream_limited(url, conditional, max_bytes)
+        # Validators are only sent when an entry exists, so a 304 always has one to reuse
+        if resp.status_code == 304 and entry:
+            data = entry.data
+            etag = resp.headers.get("ETag", entry.etag)
+            last_modified = resp.headers.get("Last-Modified", entry.last_modified)
+        else:
+            data = (bytes(raw), truncated, resp.headers.get("Content-Type", ""))
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+
+        fresh = _CachedResponse(
+            fresh_until=time.monotonic() + self.RESPONSE_CACHE_TTL,
+            etag=etag,
+            last_modified=last_modified,
+            data=data,
+        )
+        self._raw_cache.set(key, fresh)
+        return fresh
+
+    async def _get_commit_diff(
+        self, owner: str, repo: str, base: str, head: str, max_bytes: int = 1048576
+    ) -> dict[str, Any]:
         """
         Get the diff between two commits.
 
+        The diff is streamed and reading stops once max_bytes is exceeded, so huge
+        comparisons are neither fully downloaded nor decoded.
+
         Args:
             owner: Repository owner
             repo: Repository name
             base: Base commit/branch/tag
             head: Head commit/branch/tag
+            max_bytes: Maximum diff size (default 1MB)
 
         Returns:
             Dict with diff content
         """
+        if base == head:
+            # Nothing to compare; skip the round trip and its rate-limit token
+            return {
+                "repository": f"{owner}/{repo}",
+                "base": base,
+                "head": head,
+                "diff": "",
+                "size_bytes": 0,
+                "truncated": False,
+            }
+
         try:
-            headers = self._get_headers()
             # Request raw diff format
-            headers["Accept"] = "application/vnd.github.diff"
+            headers = self._get_headers("application/vnd.github.diff")
 
-            url = f"https://api.github.com/repos/{owner}/{repo}/compare/{base}...{head}"
+            url = f"{GITHUB_API}/repos/{owner}/{repo}/compare/{base}...{head}"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                diff_content = resp.text
+            raw, truncated, _ = (await self._fetch_raw(url, headers, max_bytes)).data
 
             return {
                 "repository": f"{owner}/{repo}",
                 "base": base,
                 "head": head,
-                "diff": diff_content,
-                "size_bytes": len(diff_content.encode("utf-8")),
+                "diff": raw.decode("utf-8", errors="replace"),
+                "size_bytes": len(raw),
+                "truncated": truncated,
             }
 
         except httpx.HTTPStatusError as exc:
@@ -507,6 +1134,37 @@ class GitHubProvider(BaseProvider):
                 "error": f"Failed to get diff: {exc!s}",
             }
 
+    async def _get_first_found(self, endpoints: list[str], headers: dict[str, str]) -> Any:
+        """
+        Request alternative endpoints concurrently and return the first one found.
+
+        Args:
+            endpoints: Candidate URLs in order of preference
+            headers: Request headers
+
+        Returns:
+            Parsed JSON of the first endpoint (in list order) that returned 200,
+            or an empty list if every endpoint returned 404
+
+        Raises:
+            httpx.HTTPError: The last non-404 failure when no endpoint succeeded
+        """
+        results = await asyncio.gather(
+            *(self._get_json(url, headers, allow_not_found=True) for url in endpoints),
+            return_exceptions=True,
+        )
+
+        error: BaseException | None = None
+        for result in results:
+            if isinstance(result, BaseException):
+                error = result
+            elif result is not None:
+                return result
+
+        if error:
+            raise error
+        return []
+
     async def _list_github_packages(
         self, owner: str, package_type: str = "container"
     ) -> list[dict[str, Any]]:
@@ -527,52 +1185,28 @@ class GitHubProvider(BaseProvider):
             # API endpoint differs for users vs orgs, but we don't know which one 'owner' is easily.
             # We can try orgs first, then users if it fails, or rely on the caller knowing.
             # However, the public API structure usually requires knowing if it's a user or org.
-            # Strategy: Try /users/{username}/packages first, if 404 try /orgs/{org}/packages
+            # Strategy: Query /users/{username}/packages and /orgs/{org}/packages together
+            # and prefer the users result when both exist.
 
             endpoints = [
-                f"https://api.github.com/users/{owner}/packages?package_type={package_type}",
-                f"https://api.github.com/orgs/{owner}/packages?package_type={package_type}",
+                f"{GITHUB_API}/users/{owner}/packages?package_type={package_type}",
+                f"{GITHUB_API}/orgs/{owner}/packages?package_type={package_type}",
             ]
 
-            data = []
-            error = None
-
-            async with await self._http_client() as client:
-                for url in endpoints:
-                    try:
-                        resp = await client.get(url, headers=headers)
-                        if resp.status_code == 200:
-                            data = safe_json_loads(resp.text)
-                            error = None
-                            break
-                        elif resp.status_code == 404:
-                            # Not found, try next endpoint
-                            continue
-                        else:
-                            resp.raise_for_status()
-                    except httpx.HTTPError as exc:
-                        error = exc
-                        continue
-
-                if not data and error:
-                    # If we tried both and failed, raise the last error
-                    raise error or Exception(f"Could not find packages for {owner}")
-
-            packages = []
-            for item in data:
-                packages.append(
-                    {
-                        "name": item.get("name"),
-                        "package_type": item.get("package_type"),
-                        "owner": item.get("owner", {}).get("login"),
-                        "repository": item.get("repository", {}).get("full_name"),
-                        "url": item.get("html_url"),
-                        "version_count": item.get("version_count", 0),
-                        "visibility": item.get("visibility"),
-                    }
-                )
+            data = await self._get_first_found(endpoints, headers)
 
-            return packages
+            return [
+                {
+                    "name": item.get("name"),
+                    "package_type": item.get("package_type"),
+                    "owner": item.get("owner", {}).get("login"),
+                    "repository": item.get("repository", {}).get("full_name"),
+                    "url": item.get("html_url"),
+                    "version_count": item.get("version_count", 0),
+                    "visibility": item.get("visibility"),
+                }
+                for item in data
+            ]
 
         except Exception as exc:
             # If completely failed (e.g. 404 on both), return empty list or re-raise?
@@ -593,56 +1227,42 @@ class GitHubProvider(BaseProvider):
             # /orgs/{org}/packages/{package_type}/{package_name}/versions
 
             endpoints = [
-                f"https://api.github.com/users/{owner}/packages/{package_type}/{package_name}/versions",
-                f"https://api.github.com/orgs/{owner}/packages/{package_type}/{package_name}/versions",
+                f"{GITHUB_API}/users/{owner}/packages/{package_type}/{package_name}/versions",
+                f"{GITHUB_API}/orgs/{owner}/packages/{package_type}/{package_name}/versions",
             ]
 
-            data = []
-            error = None
-
-            async with await self._http_client() as client:
-                for url in endpoints:
-                    try:
-                        resp = await client.get(url, headers=headers)
-                        if resp.status_code == 200:
-                            data = safe_json_loads(resp.text)
-                            error = None
-                            break
-                        elif resp.status_code == 404:
-                            continue
-                        else:
-                            resp.raise_for_status()
-                    except httpx.HTTPError as exc:
-                        error = exc
-                        continue
-
-                if not data and error:
-                    raise error or Exception(f"Could not find versions for {package_name}")
-
-            versions = []
-            for item in data:
-                metadata = item.get("metadata", {})
-                container_metadata = metadata.get("container", {})
-                tags = container_metadata.get("tags", [])
-
-                versions.append(
-                    {
-                        "id": item.get("id"),
-                        "name": item.get("name"),  # SHA usually
-                        "url": item.get("html_url"),
-                        "created_at": item.get("created_at"),
-                        "updated_at": item.get("updated_at"),
-                        "tags": tags,
-                    }
-                )
+            data = await self._get_first_found(endpoints, headers)
 
-            return versions
+            return [
+                {
+                    "id": item.get("id"),
+                    "name": item.get("name"),  # SHA usually
+                    "url": item.get("html_url"),
+                    "created_at": item.get("created_at"),
+                    "updated_at": item.get("updated_at"),
+                    "tags": item.get("metadata", {}).get("container", {}).get("tags", []),
+                }
+                for item in data
+            ]
 
         except Exception as exc:
             raise exc
 
     def get_tools(self) -> dict[str, Callable]:
-        """Return MCP tool functions."""
+        """
+        Return MCP tool functions.
+
+        The dict is built once per fetch setting and shared between calls; callers
+        must not mutate it.
+        """
+        fetch_enabled = is_fetch_enabled()
+        tools = self._tools.get(fetch_enabled)
+        if tools is None:
+            tools = self._tools[fetch_enabled] = self._build_tools(fetch_enabled)
+        return tools
+
+    def _build_tools(self, fetch_enabled: bool) -> dict[str, Callable]:
+        """Define the MCP tool functions, including fetch tools if fetch_enabled."""
 
         async def github_repo_search(
             query: str, limit: int = 5, language: str | None = "Python"
@@ -659,18 +1279,30 @@ class GitHubProvider(BaseProvider):
             return serialize_response_with_meta(result)
 
         async def github_code_search(
-            query: str, repo: str | None = None, limit: int = 5
+            query: str,
+            repo: str | None = None,
+            limit: int = 5,
+            path: str | None = None,
+            language: str | None = None,
         ) -> CallToolResult:
             """
-            Search for code patterns across GitHub. Returns file paths, not content.
+            Search for code patterns across GitHub. Returns file paths and matched snippets.
 
             When: Finding code examples or function definitions
             See also: get_file_content (to read found files)
             Note: Rate limited without GITHUB_TOKEN
-            Args: query="def parse_args", repo="owner/repo", limit=5
+            Args: query="def parse_args", repo="owner/repo", limit=5,
+                path="src/", language="python" (filtered by GitHub; other qualifiers
+                such as extension:py can go in the query)
             Ex: github_code_search("async def fetch", repo="psf/requests")
             """
-            result = await self._search_code(query, repo=repo, limit=limit)
+            result = await self._search_code(
+                query,
+                repo=repo,
+                limit=limit,
+                path=path,
+                language=language,
+            )
             return serialize_response_with_meta(result)
 
         async def list_github_packages(
@@ -734,21 +1366,12 @@ class GitHubProvider(BaseProvider):
             Args: repo="owner/repo", max_bytes=20480
             Ex: fetch_github_readme("psf/requests") → README content
             """
-            # Parse owner/repo format
-            parts = repo.split("/", 1)
-            if len(parts) != 2:
-                error_result = {
-                    "repository": repo,
-                    "content": "",
-                    "error": "Invalid repo format. Use 'owner/repo'",
-                    "size_bytes": 0,
-                    "source": None,
-                }
-                return serialize_response_with_meta(error_result)
-
-            owner, repo_name = parts
-            result = await self._fetch_github_readme(owner, repo_name, max_bytes)
-            return chunk_and_serialize_response(result)
+            return await _run_repo_tool(
+                repo,
+                {"content": "", "size_bytes": 0, "source": None},
+                lambda owner, name: self._fetch_github_readme(owner, name, max_bytes),
+                chunk_and_serialize_response,
+            )
 
         async def list_repo_contents(repo: str, path: str = "") -> CallToolResult:
             """
@@ -759,41 +1382,39 @@ class GitHubProvider(BaseProvider):
             Args: repo="owner/repo", path="src/utils"
             Ex: list_repo_contents("psf/requests", "requests") → dir listing
             """
-            parts = repo.split("/", 1)
-            if len(parts) != 2:
-                error_result = {
-                    "repository": repo,
-                    "path": path,
-                    "contents": [],
-                    "error": "Invalid repo format. Use 'owner/repo'",
-                }
-                return serialize_response_with_meta(error_result)
-
-            owner, repo_name = parts
-            result = await self._list_repo_contents(owner, repo_name, path)
-            return serialize_response_with_meta(result)
+            return await _run_repo_tool(
+                repo,
+                {"path": path, "contents": []},
+                lambda owner, name: self._list_repo_contents(owner, name, path),
+            )
 
-        async def get_file_content(repo: str, path: str, max_bytes: int = 102400) -> CallToolResult:
+        async def get_file_content(
+            repo: str, path: str | list[str], max_bytes: int = 102400
+        ) -> CallToolResult:
             """
-            Read file from GitHub repo. UTF-8 only, rejects binary.
+            Read file(s) from GitHub repo. UTF-8 only, rejects binary.
 
             When: Need source code or config file content
-            Args: repo="owner/repo", path="src/file.py", max_bytes=102400
+            Note: url is the default-branch (blob/HEAD) link; sha is the git blob SHA,
+                null when the file was truncated
+            Args: repo="owner/repo", path="src/file.py" or a list of up to 20 paths
+                (fetched concurrently), max_bytes=102400 per file
             Ex: get_file_content("psf/requests", "requests/api.py") → file content
             """
-            parts = repo.split("/", 1)
-            if len(parts) != 2:
+            if isinstance(path, list) and len(path) > self.MAX_BATCH_FILES:
                 error_result = {
                     "repository": repo,
-                    "path": path,
-                    "content": "",
-                    "error": "Invalid repo format. Use 'owner/repo'",
+                    "files": [],
+                    "error": f"Too many paths; request at most {self.MAX_BATCH_FILES}",
                 }
                 return serialize_response_with_meta(error_result)
 
-            owner, repo_name = parts
-            result = await self._get_file_content(owner, repo_name, path, max_bytes)
-            return serialize_response_with_meta(result)
+            fetch = self._get_file_contents if isinstance(path, list) else self._get_file_content
+            return await _run_repo_tool(
+                repo,
+                {"path": path, "content": ""},
+                lambda owner, name: fetch(owner, name, path, max_bytes),
+            )
 
         async def get_repo_tree(
             repo: str, recursive: bool = False, max_items: int = 1000
@@ -806,41 +1427,44 @@ class GitHubProvider(BaseProvider):
             Args: repo="owner/repo", recursive=True (for full tree), max_items=1000
             Ex: get_repo_tree("psf/requests", recursive=True) → complete file listing
             """
-            parts = repo.split("/", 1)
-            if len(parts) != 2:
-                error_result = {
-                    "repository": repo,
-                    "tree": [],
-                    "error": "Invalid repo format. Use 'owner/repo'",
-                }
-                return serialize_response_with_meta(error_result)
+            return await _run_repo_tool(
+                repo,
+                {"tree": []},
+                lambda owner, name: self._get_repo_tree(owner, name, recursive, max_items),
+            )
 
-            owner, repo_name = parts
-            result = await self._get_repo_tree(owner, repo_name, recursive, max_items)
-            return serialize_response_with_meta(result)
+        async def get_repo_overview(repo: str, max_bytes: int = 20480) -> CallToolResult:
+            """
+            Get a GitHub repo's description, README, and top-level files in one call.
 
-        async def get_commit_diff(repo: str, base: str, head: str) -> CallToolResult:
+            When: First look at an unfamiliar repo (replaces separate readme + tree calls)
+            See also: get_repo_tree (recursive listing), get_file_content (read files)
+            Args: repo="owner/repo", max_bytes=20480 (README)
+            Ex: get_repo_overview("psf/requests") → description, README, root listing
+            """
+            return await _run_repo_tool(
+                repo,
+                {"readme": "", "tree": []},
+                lambda owner, name: self._get_repo_overview(owner, name, max_bytes),
+                lambda data: chunk_and_serialize_response(data, content_key="readme"),
+            )
+
+        async def get_commit_diff(
+            repo: str, base: str, head: str, max_bytes: int = 1048576
+        ) -> CallToolResult:
             """
             Get diff between commits/branches/tags in a GitHub repo.
 
             When: Comparing versions or reviewing changes
-            Args: repo="owner/repo", base="main|v1.0.0|sha", head="feature|v1.1.0|sha"
+            Args: repo="owner/repo", base="main|v1.0.0|sha", head="feature|v1.1.0|sha",
+                max_bytes=1048576
             Ex: get_commit_diff("psf/requests", "v2.28.0", "v2.28.1") → diff output
             """
-            parts = repo.split("/", 1)
-            if len(parts) != 2:
-                error_result = {
-                    "repository": repo,
-                    "base": base,
-                    "head": head,
-                    "diff": "",
-                    "error": "Invalid repo format. Use 'owner/repo'",
-                }
-                return serialize_response_with_meta(error_result)
-
-            owner, repo_name = parts
-            result = await self._get_commit_diff(owner, repo_name, base, head)
-            return serialize_response_with_meta(result)
+            return await _run_repo_tool(
+                repo,
+                {"base": base, "head": head, "diff": ""},
+                lambda owner, name: self._get_commit_diff(owner, name, base, head, max_bytes),
+            )
 
         tools = {
             "github_repo_search": github_repo_search,
@@ -848,11 +1472,12 @@ class GitHubProvider(BaseProvider):
             "list_github_packages": list_github_packages,
             "get_package_versions": get_package_versions,
         }
-        if is_fetch_enabled():
+        if fetch_enabled:
             tools["fetch_github_readme"] = fetch_github_readme
             tools["list_repo_contents"] = list_repo_contents
             tools["get_file_content"] = get_file_content
             tools["get_repo_tree"] = get_repo_tree
+            tools["get_repo_overview"] = get_repo_overview
             tools["get_commit_diff"] = get_commit_diff
 
         return tools
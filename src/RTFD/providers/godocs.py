@@ -66,10 +66,10 @@ class GoDocsProvider(BaseProvider):
         # We'll use a curl-like User-Agent for this specific request.
         url = f"https://godocs.io/{package}"
         headers = {"User-Agent": "curl/7.68.0"}
-        async with await self._http_client() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+        client = await self._shared_http_client()
+        resp = await client.get(url, headers=headers)
+        resp.raise_for_status()
+        soup = BeautifulSoup(resp.text, "html.parser")
 
         # Extract description/synopsis
         description = ""
@@ -122,10 +122,10 @@ class GoDocsProvider(BaseProvider):
             url = f"https://godocs.io/{package}"
             headers = {"User-Agent": "curl/7.68.0"}
 
-            async with await self._http_client() as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._shared_http_client()
+            resp = await client.get(url, headers=headers)
+            resp.raise_for_status()
+            soup = BeautifulSoup(resp.text, "html.parser")
 
             # Extract comprehensive documentation content
             content_parts = []
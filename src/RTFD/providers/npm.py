@@ -8,7 +8,7 @@ from typing import Any
 import httpx
 from mcp.types import CallToolResult
 
-from ..content_utils import extract_sections, prioritize_sections
+from ..content_utils import extract_sections, prioritize_sections_with_size, utf8_cut
 from ..utils import (
     chunk_and_serialize_response,
     is_fetch_enabled,
@@ -61,10 +61,10 @@ class NpmProvider(BaseProvider):
     async def _fetch_metadata(self, package: str) -> dict[str, Any]:
         """Pull package metadata from the npm registry JSON API."""
         url = f"https://registry.npmjs.org/{package}"
-        async with await self._http_client() as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            payload = safe_json_loads(resp.text)
+        client = await self._shared_http_client()
+        resp = await client.get(url)
+        resp.raise_for_status()
+        payload = safe_json_loads(resp.content)
 
         # Extract repository URL
         repo_url = None
@@ -123,10 +123,10 @@ class NpmProvider(BaseProvider):
         try:
             url = f"https://registry.npmjs.org/{package}"
 
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = safe_json_loads(resp.text)
+            client = await self._shared_http_client()
+            resp = await client.get(url)
+            resp.raise_for_status()
+            data = safe_json_loads(resp.content)
 
             # npm registry includes README in "readme" field (already Markdown)
             content = data.get("readme", "")
@@ -139,29 +139,28 @@ class NpmProvider(BaseProvider):
                 )
                 source = "npm_minimal"
 
+            encoded = content.encode("utf-8")
+            truncated = len(encoded) > max_bytes
+
             # Extract and prioritize sections
             sections = extract_sections(content)
             if sections:
-                final_content = prioritize_sections(sections, max_bytes)
+                final_content, size_bytes = prioritize_sections_with_size(sections, max_bytes)
             # Fallback: simple truncation
-            elif len(content.encode("utf-8")) > max_bytes:
-                encoded = content.encode("utf-8")[:max_bytes]
-                # Handle multi-byte characters
-                while len(encoded) > 0:
-                    try:
-                        final_content = encoded.decode("utf-8")
-                        break
-                    except UnicodeDecodeError:
-                        encoded = encoded[:-1]
+            elif truncated:
+                cut = utf8_cut(encoded, max_bytes)
+                final_content = encoded[:cut].decode("utf-8")
+                size_bytes = cut
             else:
                 final_content = content
+                size_bytes = len(encoded)
 
             return {
                 "package": package,
                 "content": final_content,
-                "size_bytes": len(final_content.encode("utf-8")),
+                "size_bytes": size_bytes,
                 "source": source,
-                "truncated": len(content.encode("utf-8")) > max_bytes,
+                "truncated": truncated,
                 "version": data.get("version"),
             }
 
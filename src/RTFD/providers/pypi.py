@@ -9,7 +9,12 @@ from typing import Any
 import httpx
 from mcp.types import CallToolResult
 
-from ..content_utils import convert_rst_to_markdown, extract_sections, prioritize_sections
+from ..content_utils import (
+    convert_rst_to_markdown,
+    extract_sections,
+    prioritize_sections_with_size,
+    utf8_cut,
+)
 from ..utils import (
     chunk_and_serialize_response,
     is_fetch_enabled,
@@ -64,11 +69,11 @@ class PyPIProvider(BaseProvider):
         """
         url = f"https://pypi.org/project/{package}/"
         try:
-            async with await self._http_client() as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                # Simple check for the verified class in the HTML
-                return 'class="sidebar-section verified"' in resp.text
+            client = await self._shared_http_client()
+            resp = await client.get(url)
+            resp.raise_for_status()
+            # Simple check for the verified class in the HTML
+            return 'class="sidebar-section verified"' in resp.text
         except Exception:
             # If we can't check, assume unverified or fail safe?
             # Let's assume unverified to be safe if verification is required.
@@ -90,10 +95,10 @@ class PyPIProvider(BaseProvider):
                 }
 
         url = f"https://pypi.org/pypi/{package}/json"
-        async with await self._http_client() as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            payload = safe_json_loads(resp.text)
+        client = await self._shared_http_client()
+        resp = await client.get(url)
+        resp.raise_for_status()
+        payload = safe_json_loads(resp.content)
 
         info = payload.get("info", {})
         return {
@@ -158,8 +163,12 @@ class PyPIProvider(BaseProvider):
             if content and (".. " in content or "::" in content[:200]):
                 content = convert_rst_to_markdown(content)
 
+            # Encode once; the size checks below and the fallback cut all reuse it
+            encoded = content.encode("utf-8")
+            truncated = len(encoded) > max_bytes
+
             # 4. If insufficient content, try GitHub README
-            if len(content.encode("utf-8")) < 500:
+            if len(encoded) < 500:
                 repo_url = self._extract_github_url(metadata.get("project_urls", {}))
                 if repo_url:
                     # For now, note that GitHub fallback requires github provider
@@ -170,16 +179,21 @@ class PyPIProvider(BaseProvider):
             # 5. Extract and prioritize sections
             sections = extract_sections(content)
             if sections:
-                final_content = prioritize_sections(sections, max_bytes)
+                final_content, size_bytes = prioritize_sections_with_size(sections, max_bytes)
+            elif truncated:
+                cut = utf8_cut(encoded, max_bytes)
+                final_content = encoded[:cut].decode("utf-8")
+                size_bytes = cut
             else:
-                final_content = content[:max_bytes] if content else ""
+                final_content = content
+                size_bytes = len(encoded)
 
             return {
                 "package": package,
                 "content": final_content,
-                "size_bytes": len(final_content.encode("utf-8")),
+                "size_bytes": size_bytes,
                 "source": source,
-                "truncated": len(content.encode("utf-8")) > max_bytes,
+                "truncated": truncated,
             }
 
         except httpx.HTTPStatusError as exc:
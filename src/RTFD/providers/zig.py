@@ -64,10 +64,10 @@ class ZigProvider(BaseProvider):
         try:
             # Fetch the master documentation page
             url = "https://ziglang.org/documentation/master/"
-            async with await self._http_client() as client:
-                resp = await client.get(url, follow_redirects=True)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+            client = await self._shared_http_client()
+            resp = await client.get(url, follow_redirects=True)
+            resp.raise_for_status()
+            soup = BeautifulSoup(resp.text, "html.parser")
 
             # Build a search index of documentation sections
             sections = self._extract_doc_sections(soup)
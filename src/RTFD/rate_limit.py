@@ -0,0 +1,106 @@
+"""
+Client-side rate limiting helpers for providers that talk to throttled APIs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+
+class TokenBucket:
+    """
+    Async token bucket that paces outbound requests to a steady rate.
+
+    The bucket starts full so short bursts go out immediately; once drained,
+    callers wait for tokens to refill at ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second. A rate of 0 or less disables pacing.
+            capacity: Maximum burst size (default: one second worth of tokens).
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill, capped at capacity."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class BackoffGate:
+    """
+    Shared pause for every request to one API after it signals backoff.
+
+    When one response reports a throttle or an exhausted quota, pause() pushes the
+    resume time out, so concurrent callers wait it out in wait() instead of each
+    spending a request on the same 403/429.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an open gate."""
+        self._resume_at = 0.0
+
+    def pause(self, delay: float) -> None:
+        """Hold all callers for at least delay seconds from now."""
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    async def wait(self) -> None:
+        """Sleep until the gate reopens; returns at once if it is open."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def retry_after_seconds(
+    response: httpx.Response, default: float = 1.0, maximum: float = 30.0
+) -> float:
+    """
+    Get the delay requested by a throttling response's Retry-After header.
+
+    Args:
+        response: Response carrying an optional Retry-After header
+        default: Delay to use when the header is missing or unparseable
+        maximum: Upper bound so a single tool call never stalls for long
+
+    Returns:
+        Delay in seconds, between 0 and maximum
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return min(default, maximum)
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            delay = default
+
+    return min(max(delay, 0.0), maximum)
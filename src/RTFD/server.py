@@ -8,7 +8,10 @@ in the aggregated search_library_docs tool.
 
 from __future__ import annotations
 
+import asyncio
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -20,8 +23,18 @@ from .providers import discover_providers
 from .providers.base import BaseProvider, ToolTierInfo
 from .utils import create_http_client, get_cache_config, serialize_response_with_meta
 
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled provider HTTP clients when the server shuts down."""
+    try:
+        yield
+    finally:
+        await _close_providers()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("RTFD!")
+mcp = FastMCP("RTFD!", lifespan=_lifespan)
 
 # Initialize Cache
 _cache_manager = CacheManager()
@@ -63,6 +76,15 @@ def _get_provider_instances() -> dict[str, BaseProvider]:
     return _provider_instances
 
 
+async def _close_providers() -> None:
+    """Close shared HTTP clients held by initialized providers."""
+    for name, provider in _provider_instances.items():
+        try:
+            await provider.aclose()
+        except Exception as e:
+            sys.stderr.write(f"Warning: Failed to close provider {name}: {e}\n")
+
+
 def get_all_tool_tiers() -> dict[str, ToolTierInfo]:
     """
     Get all tool tier information from all providers and server-level tools.
@@ -135,16 +157,19 @@ async def _locate_library_docs(library: str, limit: int = 5) -> dict[str, Any]:
                 return cached_entry.data
 
     providers = _get_provider_instances()
-
-    # Query each provider that supports library search
-    for provider_name, provider in providers.items():
-        metadata = provider.get_metadata()
-
-        if not metadata.supports_library_search:
-            continue
-
-        provider_result = await provider.search_library(library, limit=limit)
-
+    searchable = [
+        (provider_name, provider)
+        for provider_name, provider in providers.items()
+        if provider.get_metadata().supports_library_search
+    ]
+
+    # Query each provider that supports library search concurrently; results are
+    # merged in provider order, so the output matches a sequential run
+    provider_results = await asyncio.gather(
+        *(provider.search_library(library, limit=limit) for _, provider in searchable)
+    )
+
+    for (provider_name, _), provider_result in zip(searchable, provider_results, strict=True):
         if provider_result.success:
             # Success: add data to result
             # Map provider name to appropriate result key
@@ -14,20 +14,79 @@ from mcp.types import CallToolResult, TextContent
 
 from .token_counter import count_tokens
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def safe_json_loads(text: str) -> Any:
-    """Parse JSON with tolerance for control characters in strings."""
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 ships with the httpx[http2] extra
+    HTTP2_AVAILABLE = False
+
+
+def safe_json_loads(text: str | bytes) -> Any:
+    """
+    Parse JSON with tolerance for control characters in strings.
+
+    Accepts raw response bytes (e.g. resp.content) so the payload is not decoded
+    to str first. Uses orjson when installed, falling back to the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is strict about control characters; relax via the stdlib parser
+            return json.loads(text, strict=False)
     try:
         return json.loads(text)
     except json.JSONDecodeError:
         return json.loads(text, strict=False)
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize values JSON has no type for.
+
+    Bytes (e.g. raw response bodies) are emitted as UTF-8 text, decoded only here at
+    the outermost encoder; anything else falls back to str().
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", errors="replace")
+    return str(obj)
+
+
+def json_dumps(data: Any) -> str:
+    """
+    Serialize tool output and cached payloads as compact JSON.
+
+    Uses orjson when installed. The stdlib encoder, with the same compact
+    separators, covers a missing orjson and the values orjson rejects
+    (integers beyond 64 bits, strings with lone surrogates).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode(
+                "utf-8"
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), default=_json_default)
+
+
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/118.0 Safari/537.36"
 )
-DEFAULT_TIMEOUT = 15.0
+# Reads get 15s for slow doc pages; an unreachable host fails within 5s instead
+DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+# Connection pool sizing for long-lived provider clients. Idle connections are kept
+# for 30s (httpx defaults to 5s) so they survive the gaps between an agent's tool calls.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0
+)
 
 
 def is_fetch_enabled() -> bool:
@@ -45,12 +104,15 @@ async def create_http_client() -> httpx.AsyncClient:
     """
     Create a configured HTTP client for provider use.
 
-    Centralizes timeout, user-agent, and redirect configuration.
+    Centralizes timeout, user-agent, redirect, and connection pool configuration.
+    HTTP/2 is negotiated when the h2 package is installed.
     """
     return httpx.AsyncClient(
         timeout=DEFAULT_TIMEOUT,
         follow_redirects=True,
         headers={"User-Agent": USER_AGENT, "Accept": "*/*"},
+        limits=DEFAULT_LIMITS,
+        http2=HTTP2_AVAILABLE,
     )
 
 
@@ -58,9 +120,11 @@ def serialize_response(data: Any) -> str:
     """
     Convert data to string format.
 
-    Uses JSON with proper escape handling for control characters.
+    Emits compact JSON (no spaces after separators) with non-ASCII text left as
+    UTF-8 rather than \\u-escaped; control characters are still escaped. Bytes
+    values are emitted as UTF-8 text and other non-JSON values as str().
     """
-    return json.dumps(data, ensure_ascii=True, default=str)
+    return json_dumps(data)
 
 
 def serialize_response_with_meta(data: Any) -> CallToolResult:
@@ -68,7 +132,7 @@ def serialize_response_with_meta(data: Any) -> CallToolResult:
     Convert data to CallToolResult with optional token statistics in _meta.
 
     When RTFD_TRACK_TOKENS=true, calculates token stats.
-    When false (default), only serializes to JSON.
+    When false (default), only serializes to JSON (same format as serialize_response).
 
     Token statistics are included in _meta field, which is NOT sent to the LLM
     and only visible in Claude Code's special logs/metadata (set RTFD_TRACK_TOKENS=true to enable).
@@ -83,7 +147,7 @@ def serialize_response_with_meta(data: Any) -> CallToolResult:
     """
     track_tokens = os.getenv("RTFD_TRACK_TOKENS", "false").lower() == "true"
 
-    response_text = json.dumps(data, ensure_ascii=True, default=str)
+    response_text = json_dumps(data)
 
     # If token tracking is disabled, just serialize to JSON
     if not track_tokens:
@@ -1,10 +1,10 @@
-"""Tests for CacheManager."""
+"""Tests for CacheManager and TTLCache."""
 
 import time
 
 import pytest
 
-from src.RTFD.cache import CacheManager
+from src.RTFD.cache import CacheManager, TTLCache
 
 
 @pytest.fixture
@@ -32,6 +32,16 @@ def test_cache_set_get(cache_manager):
     assert entry.metadata == {}
 
 
+def test_cache_set_get_non_ascii(cache_manager):
+    """Test that non-ASCII text and nested values round-trip through the cache."""
+    data = {"content": "Título — 日本語", "items": [1, 2.5, None, True]}
+    cache_manager.set("unicode", data, metadata={"etag": '"abc"'})
+
+    entry = cache_manager.get("unicode")
+    assert entry.data == data
+    assert entry.metadata == {"etag": '"abc"'}
+
+
 def test_cache_get_missing(cache_manager):
     """Test getting a missing value."""
     entry = cache_manager.get("missing_key")
@@ -111,3 +121,34 @@ def test_cache_preview_content(cache_manager):
     entry = entries["search:requests:5"]
     assert "HTTP for Humans" in entry["content_preview"]
     assert "search:requests" in entry["content_preview"]
+
+
+def test_ttl_cache_expiry():
+    """Test that TTLCache entries expire after their ttl."""
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_lru_eviction():
+    """Test that TTLCache evicts the least recently used entry past maxsize."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_zero_maxsize_disables_storage():
+    """Test that a maxsize of 0 never stores entries."""
+    cache = TTLCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
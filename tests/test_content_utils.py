@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from src.RTFD.content_utils import (
     Section,
     convert_relative_urls,
@@ -9,8 +11,10 @@ from src.RTFD.content_utils import (
     extract_sections,
     html_to_markdown,
     prioritize_sections,
+    prioritize_sections_with_size,
     score_section,
     smart_truncate,
+    utf8_cut,
 )
 
 
@@ -114,6 +118,20 @@ def test_prioritize_sections():
     assert c3 not in result
 
 
+def test_prioritize_sections_with_size():
+    """Test that the reported size matches the encoded combined content."""
+    sections = extract_sections("# Café\n\nIntro ☕\n\n## Install\n\npip install café")
+
+    content, size_bytes = prioritize_sections_with_size(sections, max_bytes=1000)
+    assert content == prioritize_sections(sections, max_bytes=1000)
+    assert size_bytes == len(content.encode("utf-8"))
+
+    # First section over the limit is truncated
+    content, size_bytes = prioritize_sections_with_size(sections, max_bytes=8)
+    assert size_bytes == len(content.encode("utf-8"))
+    assert prioritize_sections_with_size([], max_bytes=10) == ("", 0)
+
+
 def test_smart_truncate():
     """Test smart truncation logic."""
     text = "Paragraph one.\n\nParagraph two.\n\nParagraph three."
@@ -135,6 +153,15 @@ def test_smart_truncate():
     assert "Sentence two" not in truncated2
 
 
+@pytest.mark.parametrize("max_bytes", [2, 3, 4, 5, 10, 11])
+def test_smart_truncate_never_splits_multibyte_characters(max_bytes):
+    """Test that truncation lands on character boundaries within the byte limit."""
+    truncated = smart_truncate("é" * 100, max_bytes)
+
+    assert len(truncated.encode("utf-8")) <= max_bytes
+    assert truncated.strip(".") == "é" * len(truncated.strip("."))
+
+
 def test_convert_relative_urls():
     """Test relative URL conversion."""
     base = "https://example.com/docs"
@@ -157,3 +184,19 @@ def test_convert_relative_urls():
     assert (
         convert_relative_urls("![Img](img.png)", base) == "![Img](https://example.com/docs/img.png)"
     )
+
+
+@pytest.mark.parametrize(
+    ("buf", "max_bytes", "expected"),
+    [
+        (b"hello", 10, 5),
+        (b"hello", 3, 3),
+        ("ab😀".encode(), 3, 2),
+        ("ab😀".encode(), 5, 2),
+        ("ab😀".encode(), 6, 6),
+        ("é".encode(), 1, 0),
+    ],
+)
+def testutf8_cut(buf, max_bytes, expected):
+    """Test that cut points never land inside a multi-byte character."""
+    assert utf8_cut(buf, max_bytes) == expected
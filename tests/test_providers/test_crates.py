@@ -68,6 +68,7 @@ async def test_crates_search_success(provider, mock_crates_search_response):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_crates_search_response
     mock_response.text = json.dumps(mock_crates_search_response)
+    mock_response.content = json.dumps(mock_crates_search_response).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_client = AsyncMock()
@@ -95,6 +96,7 @@ async def test_crates_metadata_tool(provider, mock_crate_metadata_response):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_crate_metadata_response
     mock_response.text = json.dumps(mock_crate_metadata_response)
+    mock_response.content = json.dumps(mock_crate_metadata_response).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_client = AsyncMock()
@@ -122,6 +124,7 @@ async def test_crates_search_tool(provider, mock_crates_search_response):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_crates_search_response
     mock_response.text = json.dumps(mock_crates_search_response)
+    mock_response.content = json.dumps(mock_crates_search_response).encode()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -176,6 +179,7 @@ async def test_crates_rate_limiting(provider, mock_crates_search_response):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_crates_search_response
     mock_response.text = json.dumps(mock_crates_search_response)
+    mock_response.content = json.dumps(mock_crates_search_response).encode()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
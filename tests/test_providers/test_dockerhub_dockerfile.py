@@ -1,5 +1,5 @@
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -31,16 +31,15 @@ async def test_fetch_dockerfile_success(provider, mock_http_client):
     metadata_response = MagicMock(
         status_code=200,
         text=json.dumps(metadata_data),
+        content=json.dumps(metadata_data).encode(),
         json=MagicMock(return_value=metadata_data),
         raise_for_status=MagicMock(),
     )
 
     mock_http_client.get.side_effect = [
-        # 1. _fetch_image_metadata call
+        # 1. _fetch_image_metadata call (re-used from the in-memory cache afterwards)
         metadata_response,
-        # 2. _fetch_dockerfile re-fetch call
-        metadata_response,
-        # 3. GitHub raw content call
+        # 2. GitHub raw content call
         MagicMock(
             status_code=200,
             text="FROM debian:bookworm-slim\nRUN apt-get update",
@@ -59,7 +58,7 @@ async def test_fetch_dockerfile_success(provider, mock_http_client):
     assert result["found_in_description"] is True
 
     # Verify calls
-    assert mock_http_client.get.call_count == 3
+    assert mock_http_client.get.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -72,6 +71,7 @@ async def test_fetch_dockerfile_no_link(provider, mock_http_client):
     response = MagicMock(
         status_code=200,
         text=json.dumps(no_link_data),
+        content=json.dumps(no_link_data).encode(),
         json=MagicMock(return_value=no_link_data),
         raise_for_status=MagicMock(),
     )
@@ -103,3 +103,63 @@ async def test_tool_registration(provider):
     tools = provider.get_tools()
     assert "fetch_dockerfile" in tools
     assert callable(tools["fetch_dockerfile"])
+
+
+@pytest.mark.asyncio
+async def test_hub_get_retries_once_on_429(provider, mock_http_client):
+    # First response is throttled, the retry succeeds
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    metadata_data = {"name": "nginx", "namespace": "library"}
+    ok = MagicMock(
+        status_code=200,
+        content=json.dumps(metadata_data).encode(),
+        raise_for_status=MagicMock(),
+    )
+    mock_http_client.get.side_effect = [throttled, ok]
+
+    with patch("RTFD.providers.dockerhub.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await provider._fetch_image_metadata("nginx")
+
+    mock_sleep.assert_awaited_once_with(2.0)
+    assert mock_http_client.get.call_count == 2
+    assert result["name"] == "nginx"
+
+
+@pytest.mark.asyncio
+async def test_fetch_image_docs_reuses_cached_metadata(provider, mock_http_client):
+    # Metadata fetched once is served from memory for the docs tool
+    metadata_data = {"name": "redis", "namespace": "library", "description": "In-memory store"}
+    mock_http_client.get.return_value = MagicMock(
+        status_code=200,
+        content=json.dumps(metadata_data).encode(),
+        raise_for_status=MagicMock(),
+    )
+
+    await provider._fetch_image_metadata("redis")
+    result = await provider._fetch_image_docs("redis")
+
+    assert mock_http_client.get.call_count == 1
+    assert "In-memory store" in result["content"]
+
+
+@pytest.mark.asyncio
+async def test_search_images_formats_results(provider, mock_http_client):
+    payload = {
+        "results": [
+            {"repo_name": "nginx", "repo_owner": "", "is_official": True, "star_count": 10},
+            {"repo_name": "proxy", "repo_owner": "acme", "short_description": "Edge proxy"},
+        ]
+    }
+    mock_http_client.get.return_value = MagicMock(
+        status_code=200,
+        content=json.dumps(payload).encode(),
+        raise_for_status=MagicMock(),
+    )
+
+    result = await provider._search_images("nginx", limit=2)
+
+    assert result["count"] == 2
+    assert result["results"][0]["owner"] == "library"
+    assert result["results"][0]["url"] == "https://hub.docker.com/r/library/nginx"
+    assert result["results"][1]["url"] == "https://hub.docker.com/r/acme/proxy"
+    assert result["results"][1]["description"] == "Edge proxy"
@@ -1,7 +1,8 @@
 """Tests for GCP provider."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.RTFD.providers.gcp import GCP_SERVICE_DOCS, GcpProvider
@@ -14,6 +15,17 @@ def provider():
     return GcpProvider(create_http_client)
 
 
+def _mock_docs_client(html: str = "", status_code: int = 200, requests: list | None = None):
+    """Build a real AsyncClient whose requests are answered locally with the given page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status_code, text=html)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 def test_gcp_metadata():
     """Test GCP provider metadata."""
     provider = GcpProvider(lambda: None)
@@ -45,6 +57,8 @@ def test_gcp_normalize_service_name(provider):
     assert provider._normalize_service_name("cloud storage") == "storage"
     assert provider._normalize_service_name("google cloud storage") == "storage"
     assert provider._normalize_service_name("gcp storage") == "storage"
+    assert provider._normalize_service_name("gcp google storage") == "storage"
+    assert provider._normalize_service_name("Google Cloud Cloud Run") == "run"
 
     # Aliases
     assert provider._normalize_service_name("kubernetes") == "gke"
@@ -148,20 +162,8 @@ async def test_gcp_fetch_service_docs_known_service(provider):
     </html>
     """
 
-    # Create a mock response
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status = MagicMock()
-    mock_response.status_code = 200
-
-    # Create a mock client
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    # Mock the _http_client method
-    provider._http_client = AsyncMock(return_value=mock_client)
+    # Mock the _http_client method with a locally answered client
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(mock_html))
 
     result = await provider._fetch_service_docs("storage", max_bytes=20480)
 
@@ -172,32 +174,14 @@ async def test_gcp_fetch_service_docs_known_service(provider):
     assert result["source"] == "gcp_docs"
     assert result["docs_url"] == "https://cloud.google.com/storage/docs"
     assert "size_bytes" in result
-    assert "truncated" in result
+    assert result["truncated"] is False
 
 
 @pytest.mark.asyncio
 async def test_gcp_fetch_service_docs_404(provider):
     """Test fetching documentation for non-existent service."""
     # Mock HTTP client to return 404
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.raise_for_status = MagicMock(side_effect=Exception("404 Not Found"))
-
-    # Import httpx to use the actual exception
-    import httpx
-
-    mock_response.raise_for_status = MagicMock(
-        side_effect=httpx.HTTPStatusError(
-            "404 Not Found", request=MagicMock(), response=mock_response
-        )
-    )
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    provider._http_client = AsyncMock(return_value=mock_client)
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(status_code=404))
 
     result = await provider._fetch_service_docs("nonexistent-service", max_bytes=20480)
 
@@ -215,23 +199,14 @@ async def test_gcp_fetch_service_docs_truncation(provider):
     large_content = "<main>" + "<p>This is a paragraph. </p>" * 1000 + "</main>"
     mock_html = f"<html><body>{large_content}</body></html>"
 
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status = MagicMock()
-    mock_response.status_code = 200
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    provider._http_client = AsyncMock(return_value=mock_client)
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(mock_html))
 
     max_bytes = 500
     result = await provider._fetch_service_docs("storage", max_bytes=max_bytes)
 
     assert result["size_bytes"] <= max_bytes + 100  # Allow some margin for section headers
     assert "content" in result
+    assert result["truncated"] is True
 
 
 @pytest.mark.asyncio
@@ -266,10 +241,10 @@ async def test_gcp_service_mapping_completeness():
     for service in required_services:
         assert service in GCP_SERVICE_DOCS
         service_info = GCP_SERVICE_DOCS[service]
-        assert "name" in service_info
-        assert "url" in service_info
-        assert "api" in service_info
-        assert "description" in service_info
+        assert service_info.name
+        assert service_info.url
+        assert service_info.api
+        assert service_info.description
 
 
 @pytest.mark.asyncio
@@ -278,17 +253,7 @@ async def test_gcp_fetch_with_normalized_name(provider):
     # Mock the HTTP response
     mock_html = "<html><body><main><h1>Test</h1><p>Content</p></main></body></html>"
 
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status = MagicMock()
-    mock_response.status_code = 200
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-
-    provider._http_client = AsyncMock(return_value=mock_client)
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(mock_html))
 
     # Test with different name formats
     for service_name in ["storage", "Cloud Storage", "cloud storage"]:
@@ -327,3 +292,294 @@ def test_gcp_github_headers_with_token(provider):
             os.environ["GITHUB_TOKEN"] = old_token
         else:
             os.environ.pop("GITHUB_TOKEN", None)
+
+
+@pytest.mark.parametrize("parser", ["selectolax", "bs4"])
+def test_gcp_extract_main_html_parsers(provider, monkeypatch, parser):
+    """Test that both HTML backends extract the same main content."""
+    monkeypatch.setenv("RTFD_GCP_HTML_PARSER", parser)
+    html = (
+        "<html><body><nav>Site nav</nav>"
+        "<div class='devsite-article-body'><header>Top</header><h1>Overview</h1>"
+        "<p>Body text</p><script>track()</script><footer>Bottom</footer></div>"
+        "</body></html>"
+    )
+
+    main_html = provider._extract_main_html(html)
+
+    assert "<h1>Overview</h1>" in main_html
+    assert "Body text" in main_html
+    for junk in ("Site nav", "Top", "track()", "Bottom"):
+        assert junk not in main_html
+    assert provider._extract_main_html("<html><body><p>No main</p></body></html>") is None
+
+
+@pytest.mark.parametrize("parser", ["selectolax", "bs4"])
+def test_gcp_extract_search_links_parsers(provider, monkeypatch, parser):
+    """Test that both HTML backends extract search result links."""
+    monkeypatch.setenv("RTFD_GCP_HTML_PARSER", parser)
+    html = (
+        "<html><body><div><h3><a track-type='search-result' href='/run/docs'>"
+        " Cloud Run </a></h3><p>Deploy containers</p></div></body></html>"
+    )
+
+    links = provider._extract_search_links(html)
+
+    assert links == [("Cloud Run", "/run/docs", "Cloud Run Deploy containers")]
+
+
+@pytest.mark.asyncio
+async def test_gcp_reuses_shared_http_client(provider):
+    """Test that GCP requests share one pooled client until aclose()."""
+    requests: list[httpx.Request] = []
+    client = _mock_docs_client(
+        "<html><body><main><h1>Run</h1></main></body></html>", requests=requests
+    )
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._fetch_service_docs("run")
+    await provider._fetch_service_docs("storage")
+
+    provider._http_client.assert_awaited_once()
+    assert len(requests) == 2
+
+    await provider.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_merges_remote_backends(provider):
+    """Test that remote backends are merged in order and failures are skipped."""
+    cloud = [{"name": "Cloud result", "source": "cloud_google_com"}]
+    github = [{"name": "GitHub result", "source": "github_googleapis"}]
+
+    with (
+        patch.object(provider, "_search_cloud_google_com", AsyncMock(return_value=cloud)),
+        patch.object(provider, "_search_github_googleapis", AsyncMock(return_value=github)),
+    ):
+        result = await provider._search_services("zzqx-unmapped", limit=5)
+    assert [r["name"] for r in result] == ["Cloud result", "GitHub result"]
+
+    with (
+        patch.object(provider, "_search_cloud_google_com", AsyncMock(return_value=cloud)),
+        patch.object(
+            provider, "_search_github_googleapis", AsyncMock(side_effect=Exception("boom"))
+        ),
+    ):
+        result = await provider._search_services("zzqx-unmapped-other", limit=5)
+    assert [r["name"] for r in result] == ["Cloud result"]
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_contextual_first_word(provider):
+    """Test that a multi-word query resolves its first word as the service."""
+    result = await provider._search_services("gke audit", limit=5)
+
+    assert result[0]["name"] == "Google Kubernetes Engine"
+    assert result[0]["source"] == "gcp_mapping_contextual"
+    assert "(searching for: audit)" in result[0]["description"]
+    assert all(r["name"] != "Google Kubernetes Engine" for r in result[1:])
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_partial_match_order(provider):
+    """Test that partial matches are substring-based and follow mapping order."""
+    result = await provider._search_services("nosql kube", limit=10)
+    names = [r["name"] for r in result]
+
+    assert names == [
+        "Cloud Firestore",
+        "Cloud Datastore",
+        "Cloud Bigtable",
+        "Google Kubernetes Engine",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_cached(provider):
+    """Test that repeat searches are served from the in-memory cache."""
+    cloud = AsyncMock(return_value=[{"name": "Cloud result", "source": "cloud_google_com"}])
+
+    with (
+        patch.object(provider, "_search_cloud_google_com", cloud),
+        patch.object(provider, "_search_github_googleapis", AsyncMock(return_value=[])),
+    ):
+        first = await provider._search_services("zzqx-cached", limit=3)
+        second = await provider._search_services("ZZQX-cached", limit=3)
+
+    assert first == second
+    cloud.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_does_not_cache_empty_remote(provider):
+    """Test that empty remote results are retried rather than cached."""
+    cloud = AsyncMock(return_value=[])
+
+    with (
+        patch.object(provider, "_search_cloud_google_com", cloud),
+        patch.object(provider, "_search_github_googleapis", AsyncMock(return_value=[])),
+    ):
+        await provider._search_services("zzqx-empty", limit=3)
+        await provider._search_services("zzqx-empty", limit=3)
+
+    assert cloud.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gcp_fetch_service_docs_cached(provider):
+    """Test that extracted docs are cached per (docs_url, max_bytes)."""
+    requests: list[httpx.Request] = []
+    html = "<html><body><main><h1>Pub/Sub</h1><p>Messaging</p></main></body></html>"
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(html, requests=requests))
+
+    first = await provider._fetch_service_docs("pubsub", max_bytes=20480)
+    second = await provider._fetch_service_docs("Pub/Sub", max_bytes=20480)
+    assert first == second
+    assert len(requests) == 1
+
+    await provider._fetch_service_docs("pubsub", max_bytes=1024)
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_gcp_fetch_html_stops_at_budget(provider):
+    """Test that page streaming stops once the raw byte budget is exceeded."""
+
+    async def body():
+        for _ in range(100):
+            yield b"<p>" + b"x" * 1021 + b"</p>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    page = await provider._fetch_html("https://cloud.google.com/run/docs", {}, max_bytes=4096)
+
+    assert 4096 < len(page) <= 4096 + 1028
+
+
+@pytest.mark.asyncio
+async def test_gcp_fetch_service_docs_truncation_multibyte_split(provider):
+    """Test that raw truncation drops a multi-byte character split at the cut."""
+    html = "<html><body><main><p>" + "é" * 300 + "</p></main></body></html>"
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(html))
+
+    with patch("src.RTFD.providers.gcp.extract_sections", return_value=[]):
+        result = await provider._fetch_service_docs("storage", max_bytes=101)
+
+    assert result["content"] == "é" * 50
+    assert result["size_bytes"] == 100
+
+
+@pytest.mark.parametrize("parser", ["selectolax", "bs4"])
+def test_gcp_extract_main_html_prefers_article_body(provider, monkeypatch, parser):
+    """Test that the article body wins over an enclosing <article>, and <main> over both."""
+    monkeypatch.setenv("RTFD_GCP_HTML_PARSER", parser)
+    html = (
+        "<html><body><article><h1>Breadcrumbs</h1>"
+        "<div class='devsite-article-body'><p>Body</p></div></article></body></html>"
+    )
+
+    main_html = provider._extract_main_html(html)
+    assert main_html.startswith("<div")
+    assert "Breadcrumbs" not in main_html
+
+    wrapped = html.replace("<body>", "<body><main>").replace("</body>", "</main></body>")
+    assert provider._extract_main_html(wrapped).startswith("<main>")
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_exact_match_skips_partial_scan(provider):
+    """Test that an exact match filling the limit skips partial matching."""
+    with patch("src.RTFD.providers.gcp._services_matching_word") as matching:
+        result = await provider._search_services("bigquery", limit=1)
+
+    assert [r["name"] for r in result] == ["BigQuery"]
+    matching.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_short_words_skip_partial_scan(provider):
+    """Test that a query of only very short words goes straight to remote search."""
+    with (
+        patch("src.RTFD.providers.gcp._services_matching_word") as matching,
+        patch.object(provider, "_search_cloud_google_com", AsyncMock(return_value=[])) as cloud,
+        patch.object(provider, "_search_github_googleapis", AsyncMock(return_value=[])),
+    ):
+        result = await provider._search_services("a b", limit=3)
+
+    assert result == []
+    matching.assert_not_called()
+    cloud.assert_awaited_once()
+
+
+def test_gcp_github_headers_cached_until_token_changes(provider, monkeypatch):
+    """Test that GitHub headers are reused until the auth configuration changes."""
+    monkeypatch.setenv("GITHUB_AUTH", "token")
+    monkeypatch.setenv("GITHUB_TOKEN", "first_token")
+
+    with patch("src.RTFD.providers.gcp.get_github_token", side_effect=["first", "second"]) as get:
+        assert provider._get_github_headers()["Authorization"] == "token first"
+        assert provider._get_github_headers()["Authorization"] == "token first"
+        assert get.call_count == 1
+
+        monkeypatch.setenv("GITHUB_TOKEN", "second_token")
+        assert provider._get_github_headers()["Authorization"] == "token second"
+        assert get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_services_coalesces_concurrent_queries(provider):
+    """Test that identical in-flight searches share one backend request."""
+    import asyncio
+
+    async def slow_cloud(query, limit):
+        await asyncio.sleep(0.01)
+        return [{"name": "Cloud result", "source": "cloud_google_com"}]
+
+    cloud = AsyncMock(side_effect=slow_cloud)
+    with (
+        patch.object(provider, "_search_cloud_google_com", cloud),
+        patch.object(provider, "_search_github_googleapis", AsyncMock(return_value=[])),
+    ):
+        results = await asyncio.gather(
+            *(provider._search_services("zzqx-burst", limit=3) for _ in range(3))
+        )
+
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+    cloud.assert_awaited_once()
+    assert provider._inflight_searches == {}
+
+
+@pytest.mark.asyncio
+async def test_gcp_search_github_googleapis_results(provider):
+    """Test that googleapis paths map to known services or generic results."""
+    payload = (
+        '{"items": [{"path": "google/cloud/storage/v2/storage.proto"},'
+        ' {"path": "google/cloud/ids/v1/ids.proto"}]}'
+    )
+    provider._http_client = AsyncMock(return_value=_mock_docs_client(payload))
+
+    with patch("src.RTFD.providers.gcp.get_github_token", return_value=None):
+        results = await provider._search_github_googleapis("proto", limit=5)
+
+    assert results == [
+        {
+            "name": "Cloud Storage",
+            "description": "Object storage for companies of all sizes",
+            "api": "storage.googleapis.com",
+            "docs_url": "https://cloud.google.com/storage/docs",
+            "source": "github_googleapis",
+        },
+        {
+            "name": "Ids",
+            "description": "Google Cloud ids service",
+            "api": "ids.googleapis.com",
+            "docs_url": "https://cloud.google.com/ids/docs",
+            "source": "github_googleapis",
+        },
+    ]
@@ -1,8 +1,23 @@
 """Tests for GitHub provider."""
 
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
 import pytest
 
-from src.RTFD.providers.github import GitHubProvider
+from src.RTFD.providers.github import (
+    GitHubProvider,
+    _decode_base64_prefix,
+    _decode_text_bytes,
+    _normalize_search_query,
+    _parse_repo,
+    _rate_limit_resource,
+    _truncate_utf8,
+)
 from src.RTFD.utils import create_http_client
 
 
@@ -35,6 +50,80 @@ def test_github_get_tools():
     assert callable(tools["github_code_search"])
 
 
+def test_github_get_tools_is_cached_per_fetch_setting(monkeypatch):
+    """Test that tools are built once per RTFD_FETCH value."""
+    monkeypatch.setenv("RTFD_FETCH", "true")
+    provider = GitHubProvider(lambda: None)
+
+    tools = provider.get_tools()
+    assert provider.get_tools() is tools
+    assert "get_file_content" in tools
+
+    monkeypatch.setenv("RTFD_FETCH", "false")
+    search_only = provider.get_tools()
+    assert "get_file_content" not in search_only
+    assert provider.get_tools() is search_only
+
+
+@pytest.mark.asyncio
+async def test_github_reuses_shared_http_client(provider):
+    """Test that GitHub requests share one pooled client until aclose()."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"name": "README.md", "path": "README.md"}])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._list_repo_contents("psf", "requests")
+    await provider._list_repo_contents("psf", "requests", "docs")
+
+    provider._http_client.assert_awaited_once()
+    assert len(requests) == 2
+
+    await provider.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_github_tools_share_one_http_client(provider):
+    """Test that search, file, tree, diff, listing, and README helpers reuse one client."""
+    encoded = base64.b64encode(b"# Title\n").decode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # No helper's header overrides may drop compressed transfer
+        assert "gzip" in request.headers["Accept-Encoding"]
+        path = request.url.path
+        if path.startswith("/search/"):
+            return httpx.Response(200, json={"items": []})
+        if path.endswith("/readme"):
+            return httpx.Response(200, json={"content": encoded, "encoding": "base64"})
+        if "/compare/" in path:
+            return httpx.Response(200, content=b"diff --git a/x b/x\n")
+        if "/git/trees/" in path:
+            return httpx.Response(200, json={"tree": [], "truncated": False})
+        if path.endswith("/contents/"):
+            return httpx.Response(200, json=[])
+        if "/contents/" in path:
+            return httpx.Response(200, content=b"print('hi')\n")
+        return httpx.Response(200, json={"default_branch": "main"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._search_repos("requests")
+    await provider._search_code("Session", repo="o/r")
+    await provider._fetch_github_readme("o", "r")
+    await provider._get_file_content("o", "r", "a.py")
+    await provider._get_repo_tree("o", "r")
+    await provider._get_commit_diff("o", "r", "a", "b")
+    await provider._list_repo_contents("o", "r")
+
+    provider._http_client.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_github_search_repos_success(provider):
     """Test repository search on GitHub (may fail due to rate limits)."""
@@ -295,3 +384,1094 @@ async def test_get_repo_tree_tool(provider):
     except Exception as e:
         # May fail due to rate limits
         assert "403" in str(e) or "rate limit" in str(e).lower()
+
+
+def _mock_packages_client(responses: dict[str, httpx.Response]) -> httpx.AsyncClient:
+    """Build a client answering by URL path prefix (``/users`` or ``/orgs``)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prefix = request.url.path.split("/")[1]
+        return responses.get(prefix, httpx.Response(404))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_list_github_packages_falls_back_to_org(provider):
+    """Test that an org owner is resolved when the users endpoint 404s."""
+    client = _mock_packages_client(
+        {"orgs": httpx.Response(200, json=[{"name": "app", "owner": {"login": "acme"}}])}
+    )
+    provider._http_client = AsyncMock(return_value=client)
+
+    packages = await provider._list_github_packages("acme")
+
+    assert [p["name"] for p in packages] == ["app"]
+    assert packages[0]["owner"] == "acme"
+
+
+@pytest.mark.asyncio
+async def test_get_package_versions_prefers_users_endpoint(provider):
+    """Test that the users result wins when both endpoints succeed."""
+    client = _mock_packages_client(
+        {
+            "users": httpx.Response(200, json=[{"id": 1, "name": "sha-user"}]),
+            "orgs": httpx.Response(200, json=[{"id": 2, "name": "sha-org"}]),
+        }
+    )
+    provider._http_client = AsyncMock(return_value=client)
+
+    versions = await provider._get_package_versions("acme", "container", "app")
+
+    assert [v["name"] for v in versions] == ["sha-user"]
+
+
+@pytest.mark.asyncio
+async def test_list_github_packages_not_found_and_errors(provider):
+    """Test that 404 on both endpoints is empty and other failures are raised."""
+    provider._http_client = AsyncMock(return_value=_mock_packages_client({}))
+    assert await provider._list_github_packages("nobody") == []
+
+    await provider.aclose()
+    provider._http_client = AsyncMock(
+        return_value=_mock_packages_client({"users": httpx.Response(403)})
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider._list_github_packages("acme")
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_caches_and_revalidates_with_etag(provider):
+    """Test that fresh hits skip the network and stale hits send If-None-Match."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"name": "requests"}, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    url = "https://api.github.com/repos/psf/requests"
+
+    assert await provider._get_json(url, {}) == {"name": "requests"}
+    assert await provider._get_json(url, {}) == {"name": "requests"}
+    assert len(requests) == 1
+
+    stale_at = time.monotonic() + provider.RESPONSE_CACHE_TTL + 1
+    with patch("src.RTFD.providers.github.time.monotonic", return_value=stale_at):
+        assert await provider._get_json(url, {}) == {"name": "requests"}
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_does_not_cache_errors(provider):
+    """Test that error responses are raised and retried on the next call."""
+    statuses = [500, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json={"ok": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    url = "https://api.github.com/repos/psf/requests"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider._get_json(url, {})
+    assert await provider._get_json(url, {}) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_coalesces_concurrent_requests(provider):
+    """Test that identical concurrent GETs share one request."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"items": []})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    results = await asyncio.gather(*(provider._search_repos("httpx") for _ in range(3)))
+
+    assert results == [[], [], []]
+    assert len(requests) == 1
+    assert not provider._inflight_requests
+
+
+@pytest.mark.asyncio
+async def test_get_commit_diff_truncates_at_max_bytes(provider):
+    """Test that large diffs are cut at max_bytes on a character boundary."""
+    body = ("+" + "é" * 50 + "\n").encode("utf-8") * 100
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Accept"] == "application/vnd.github.diff"
+        assert "gzip" in request.headers["Accept-Encoding"]
+        return httpx.Response(200, content=body)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._get_commit_diff("psf", "requests", "v1", "v2", max_bytes=50)
+    assert result["truncated"] is True
+    assert result["size_bytes"] == 49
+    assert result["diff"] == "+" + "é" * 24
+
+    result = await provider._get_commit_diff("psf", "requests", "v1", "v2")
+    assert result["truncated"] is False
+    assert result["size_bytes"] == len(body)
+    assert result["diff"] == body.decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_get_commit_diff_revalidates_with_etag(provider):
+    """Test that repeated diffs are cached and revalidated with If-None-Match."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304, headers={"ETag": '"abc"'})
+        return httpx.Response(200, content=b"+line\n", headers={"ETag": '"abc"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    first = await provider._get_commit_diff("psf", "requests", "v1", "v2")
+    cached = await provider._get_commit_diff("psf", "requests", "v1", "v2")
+    assert len(requests) == 1
+
+    stale_at = time.monotonic() + provider.RESPONSE_CACHE_TTL + 1
+    with patch("src.RTFD.providers.github.time.monotonic", return_value=stale_at):
+        revalidated = await provider._get_commit_diff("psf", "requests", "v1", "v2")
+
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"abc"'
+    assert first["diff"] == cached["diff"] == revalidated["diff"] == "+line\n"
+
+
+@pytest.mark.asyncio
+async def test_raw_reads_revalidate_with_last_modified(provider):
+    """Test that raw bodies carrying only Last-Modified revalidate with If-Modified-Since."""
+    stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-Modified-Since") == stamp:
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"x = 1\n", headers={"Last-Modified": stamp})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._get_file_content("o", "r", "a.py")
+    stale_at = time.monotonic() + provider.RESPONSE_CACHE_TTL + 1
+    with patch("src.RTFD.providers.github.time.monotonic", return_value=stale_at):
+        result = await provider._get_file_content("o", "r", "a.py")
+
+    assert result["content"] == "x = 1\n"
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[1].headers
+
+
+@pytest.mark.parametrize(
+    ("content", "max_bytes", "expected"),
+    [
+        ("hello", 10, ("hello", 5, False)),
+        ("hello", 5, ("hello", 5, False)),
+        ("hello world", 5, ("hello", 5, True)),
+        ("ab😀cd", 4, ("ab", 2, True)),
+        ("ab😀cd", 6, ("ab😀", 6, True)),
+        ("éé", 3, ("é", 2, True)),
+    ],
+)
+def test_truncate_utf8(content, max_bytes, expected):
+    """Test UTF-8 truncation never splits a multi-byte character."""
+    assert _truncate_utf8(content, max_bytes) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_truncates_multibyte(provider):
+    """Test that file content truncation reports the truncated byte size."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content="😀😀😀".encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._get_file_content("o", "r", "emoji.txt", max_bytes=10)
+    assert result["content"] == "😀😀"
+    assert result["size_bytes"] == 8
+    assert result["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_github_readme_decodes_wrapped_base64(provider):
+    """Test that GitHub's newline-wrapped base64 content is decoded."""
+    readme = "# Title\n\n" + "Café docs. " * 200
+    encoded = base64.encodebytes(readme.encode()).decode()
+    assert "\n" in encoded
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"content": encoded, "path": "README.md"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._fetch_github_readme("o", "r", max_bytes=100000)
+    assert result["content"] == readme
+    assert result["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_search_repos_projects_and_limits_items(provider):
+    """Test that repository hits are projected and capped at limit."""
+    items = [
+        {"full_name": f"o/r{i}", "description": None, "html_url": f"u{i}", "default_branch": "main"}
+        for i in range(3)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"items": items})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    repos = await provider._search_repos("r", limit=2)
+    assert repos == [
+        {"name": "o/r0", "description": "", "stars": 0, "url": "u0", "default_branch": "main"},
+        {"name": "o/r1", "description": "", "stars": 0, "url": "u1", "default_branch": "main"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_code_handles_null_items(provider):
+    """Test that a null items field yields no hits."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"total_count": 0, "items": None})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    assert await provider._search_code("missing") == []
+
+
+@pytest.mark.asyncio
+async def test_search_repos_shares_cache_across_spellings(provider):
+    """Test that queries differing only in case and spacing make one request."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"items": []})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._search_repos("FastAPI")
+    await provider._search_repos("  fastapi ")
+    await provider._search_repos("FastAPI NOT user:Tiangolo")
+
+    assert [r.url.params["q"] for r in requests] == [
+        "fastapi language:Python",
+        "fastapi NOT user:Tiangolo language:Python",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("  FastAPI   Router ", "fastapi router"),
+        ('Web "Foo  Bar" NOT x', 'web "Foo  Bar" NOT x'),
+        ('path:"Src Dir" Hello', 'path:"Src Dir" hello'),
+        ('x "open  Phrase', 'x "open  Phrase'),
+    ],
+)
+def test_normalize_search_query(query, expected):
+    """Test that case and spacing are normalized only outside quoted phrases."""
+    assert _normalize_search_query(query) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_code_sends_scope_qualifiers(provider):
+    """Test that path and language scopes become search qualifiers."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"items": []})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._search_code("Session", repo="psf/requests", path="src/", language="python")
+
+    assert requests[0].url.params["q"] == "session repo:psf/requests path:src/ language:python"
+
+
+@pytest.mark.asyncio
+async def test_search_code_returns_text_match_fragments(provider):
+    """Test that code search asks for text matches and returns their fragments."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        item = {
+            "name": "sessions.py",
+            "path": "src/requests/sessions.py",
+            "repository": {"full_name": "psf/requests"},
+            "html_url": "https://github.com/psf/requests/blob/main/src/requests/sessions.py",
+            "text_matches": [{"fragment": "class Session:", "matches": []}],
+        }
+        return httpx.Response(200, json={"items": [item, {"name": "other.py"}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    results = await provider._search_code("class Session", repo="psf/requests")
+
+    assert requests[0].headers["Accept"] == "application/vnd.github.text-match+json"
+    assert results[0]["fragments"] == ["class Session:"]
+    assert results[1]["fragments"] == []
+
+
+def test_github_headers_cached_until_token_changes(provider, monkeypatch):
+    """Test that headers are reused until the auth configuration changes."""
+    monkeypatch.setenv("GITHUB_AUTH", "token")
+    monkeypatch.setenv("GITHUB_TOKEN", "first_token")
+
+    with patch(
+        "src.RTFD.providers.github.get_github_token", side_effect=["first", "second"]
+    ) as get:
+        assert provider._get_headers()["Authorization"] == "token first"
+        assert provider._get_headers()["Authorization"] == "token first"
+        assert get.call_count == 1
+
+        monkeypatch.setenv("GITHUB_TOKEN", "second_token")
+        assert provider._get_headers()["Authorization"] == "token second"
+        assert get.call_count == 2
+
+
+def test_github_headers_cached_per_accept_type(provider):
+    """Test that Accept variants are cached and share one token lookup."""
+    with patch("src.RTFD.providers.github.get_github_token", return_value="tok") as get:
+        diff = provider._get_headers("application/vnd.github.diff")
+        assert provider._get_headers("application/vnd.github.diff") is diff
+        assert diff["Accept"] == "application/vnd.github.diff"
+        assert diff["Authorization"] == "token tok"
+        assert provider._get_headers()["Accept"] == "application/vnd.github+json"
+        assert get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_commit_diff_does_not_mutate_cached_headers(provider):
+    """Test that the diff Accept override leaves the shared headers intact."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"diff --git a/x b/x\n")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._get_commit_diff("o", "r", "v1", "v2")
+    assert provider._get_headers()["Accept"] == "application/vnd.github+json"
+
+
+def _mock_tree_client(head_status: int, requests: list[httpx.Request]) -> httpx.AsyncClient:
+    """Build a client serving repo metadata and a tree for HEAD or the dev branch."""
+    tree = {"tree": [{"path": "setup.py", "type": "blob", "size": 10}], "truncated": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path = request.url.path
+        if path == "/repos/o/r":
+            return httpx.Response(200, json={"default_branch": "dev"})
+        if path == "/repos/o/r/git/trees/HEAD" and head_status != 200:
+            return httpx.Response(head_status)
+        return httpx.Response(200, json=tree)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_get_repo_overview_fetches_parts_concurrently(provider):
+    """Test that the overview shares one metadata request and reports a missing README."""
+    requests: list[httpx.Request] = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        requests.append(request)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        path = request.url.path
+        if path == "/repos/o/r":
+            return httpx.Response(
+                200, json={"default_branch": "dev", "description": "Demo", "stargazers_count": 3}
+            )
+        if path == "/repos/o/r/readme":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"tree": [{"path": "setup.py", "type": "blob"}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._get_repo_overview("o", "r")
+
+    assert result["description"] == "Demo"
+    assert result["stars"] == 3
+    assert result["default_branch"] == "dev"
+    assert result["readme"] == ""
+    assert result["readme_error"] == "GitHub returned 404"
+    assert [item["path"] for item in result["tree"]] == ["setup.py"]
+    assert sorted(r.url.path for r in requests) == [
+        "/repos/o/r",
+        "/repos/o/r/git/trees/HEAD",
+        "/repos/o/r/readme",
+    ]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("max_items", "count", "truncated"), [(0, 0, True), (1, 1, False), (2, 1, False)]
+)
+async def test_get_repo_tree_truncated_only_past_max_items(provider, max_items, count, truncated):
+    """Test that a tree exactly max_items long is not reported as truncated."""
+    provider._http_client = AsyncMock(return_value=_mock_tree_client(200, []))
+
+    result = await provider._get_repo_tree("o", "r", recursive=True, max_items=max_items)
+
+    assert result["count"] == count
+    assert result["truncated"] is truncated
+
+
+@pytest.mark.asyncio
+async def test_get_repo_tree_fetches_head_tree_with_metadata(provider):
+    """Test that the HEAD tree is requested alongside the repo metadata."""
+    requests: list[httpx.Request] = []
+    provider._http_client = AsyncMock(return_value=_mock_tree_client(200, requests))
+
+    result = await provider._get_repo_tree("o", "r", recursive=True)
+
+    assert result["branch"] == "dev"
+    assert [item["path"] for item in result["tree"]] == ["setup.py"]
+    assert sorted(str(r.url) for r in requests) == [
+        "https://api.github.com/repos/o/r",
+        "https://api.github.com/repos/o/r/git/trees/HEAD?recursive=1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_repo_tree_reuses_cached_repo_metadata(provider):
+    """Test that a warm default-branch lookup leaves the tree as the only request."""
+    requests: list[httpx.Request] = []
+    provider._http_client = AsyncMock(return_value=_mock_tree_client(200, requests))
+
+    await provider._get_repo_tree("o", "r", recursive=True)
+    requests.clear()
+    result = await provider._get_repo_tree("o", "r")
+    await provider._get_repo_tree("o", "r")
+
+    assert result["branch"] == "dev"
+    assert [str(r.url) for r in requests] == ["https://api.github.com/repos/o/r/git/trees/HEAD"]
+
+
+@pytest.mark.asyncio
+async def test_get_repo_tree_falls_back_to_default_branch(provider):
+    """Test that an unresolvable HEAD falls back to the default branch tree."""
+    requests: list[httpx.Request] = []
+    provider._http_client = AsyncMock(return_value=_mock_tree_client(422, requests))
+
+    result = await provider._get_repo_tree("o", "r")
+
+    assert result["branch"] == "dev"
+    assert result["count"] == 1
+    assert str(requests[-1].url) == "https://api.github.com/repos/o/r/git/trees/dev"
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_allow_not_found(provider):
+    """Test that allowed 404s return None while others still raise."""
+    provider._http_client = AsyncMock(return_value=_mock_packages_client({}))
+    url = "https://api.github.com/users/nobody/packages"
+
+    assert await provider._get_json(url, {}, allow_not_found=True) is None
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider._get_json(url, {})
+
+
+@pytest.mark.asyncio
+async def test_github_requests_bounded_by_max_concurrency(monkeypatch):
+    """Test that GITHUB_MAX_CONCURRENCY caps simultaneous requests."""
+    monkeypatch.setenv("GITHUB_MAX_CONCURRENCY", "2")
+    provider = GitHubProvider(create_http_client)
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    await asyncio.gather(
+        *(provider._get_json(f"https://api.github.com/repos/o/r{i}", {}) for i in range(5))
+    )
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_github_retries_rate_limited_request_once(provider):
+    """Test that a secondary rate limit is retried after Retry-After."""
+    responses = [
+        httpx.Response(403, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"name": "requests"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        data = await provider._get_json("https://api.github.com/repos/psf/requests", {})
+
+    assert data == {"name": "requests"}
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.await_args.args[0] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_github_retries_rate_limited_stream_once(provider):
+    """Test that streamed raw reads get the same single rate-limit retry."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(200, content=b"x = 1\n"),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await provider._get_file_content("o", "r", "a.py")
+
+    assert result["content"] == "x = 1\n"
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.await_args.args[0] <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_github_exhausted_quota_pauses_next_requests(provider):
+    """Test that a response spending the last token holds later requests until reset."""
+    reset = str(int(time.time()) + 5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+        if request.url.path.endswith("/second"):
+            headers = {}
+        return httpx.Response(200, json={}, headers=headers)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await provider._get_json("https://api.github.com/first", {})
+        mock_sleep.assert_not_called()
+        await provider._get_json("https://api.github.com/second", {})
+
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.await_args.args[0] <= 5
+
+
+@pytest.mark.asyncio
+async def test_github_search_throttle_does_not_pause_other_resources(provider):
+    """Test that a throttled search only holds requests against the search budget."""
+    throttled = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal throttled
+        if request.url.path.startswith("/search/") and not throttled:
+            throttled = True
+            return httpx.Response(429, headers={"Retry-After": "5"})
+        if request.url.host == "raw.githubusercontent.com":
+            return httpx.Response(200, content=b"x = 1\n")
+        return httpx.Response(200, json={"items": []})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        assert await provider._search_code("Session") == []
+        assert mock_sleep.await_count == 1
+        await provider._get_json("https://api.github.com/repos/o/r", {})
+        await provider._get_file_content("o", "r", "a.py")
+        assert mock_sleep.await_count == 1
+        await provider._search_code("Session", repo="o/r")
+
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.parametrize(
+    ("url", "resource"),
+    [
+        ("https://api.github.com/search/code?q=x", "code_search"),
+        ("https://api.github.com/search/repositories", "search"),
+        ("https://api.github.com/repos/o/r", "core"),
+        ("https://raw.githubusercontent.com/o/r/HEAD/a.py", "raw"),
+    ],
+)
+def test_rate_limit_resource(url, resource):
+    """Test that request URLs map to GitHub's separate rate-limit budgets."""
+    assert _rate_limit_resource(url) == resource
+
+
+def test_github_rate_limit_delay(provider):
+    """Test which throttling responses are worth waiting out."""
+    now = time.time()
+    exhausted = {"X-RateLimit-Remaining": "0"}
+
+    assert provider._rate_limit_delay(httpx.Response(404)) is None
+    assert provider._rate_limit_delay(httpx.Response(403)) is None
+    assert provider._rate_limit_delay(httpx.Response(429, headers={"Retry-After": "5"})) == 5.0
+    soon = httpx.Response(403, headers={**exhausted, "X-RateLimit-Reset": str(int(now) + 5)})
+    assert 0 < provider._rate_limit_delay(soon) <= 5
+    later = httpx.Response(403, headers={**exhausted, "X-RateLimit-Reset": str(int(now) + 3600)})
+    assert provider._rate_limit_delay(later) is None
+
+
+@pytest.mark.parametrize(
+    ("repo", "expected"),
+    [
+        ("psf/requests", ("psf", "requests")),
+        ("owner/repo/extra", None),
+        ("psf/re quests", None),
+        ("requests", None),
+        ("psf/", None),
+        ("/requests", None),
+    ],
+)
+def test_parse_repo(repo, expected):
+    """Test owner/repo argument parsing."""
+    assert _parse_repo(repo) == expected
+
+
+@pytest.mark.parametrize("size", [0, 10, 2047, 2048, 2049, 100_000])
+@pytest.mark.parametrize("line_length", [60, 76, 4])
+def test_decode_base64_prefix_matches_full_decode(size, line_length):
+    """Test that the decoded prefix agrees with a full decode up to max_bytes + 1."""
+    raw = bytes(range(256)) * (size // 256 + 1)
+    raw = raw[:size]
+    flat = base64.b64encode(raw).decode()
+    encoded = "\n".join(flat[i : i + line_length] for i in range(0, len(flat), line_length))
+
+    decoded = _decode_base64_prefix(encoded, 2048)
+
+    assert decoded[:2049] == raw[:2049]
+    assert len(decoded) >= min(size, 2049)
+
+
+def _mock_large_file_client(
+    body: bytes, requests: list[httpx.Request], encoding: str | None = "none"
+) -> httpx.AsyncClient:
+    """Build a client for a file too large for inline contents API content."""
+    download_url = "https://raw.githubusercontent.com/o/r/main/big.txt"
+    meta = {
+        "type": "file",
+        "content": "",
+        "size": len(body),
+        "download_url": download_url,
+        "path": "big.txt",
+    }
+    if encoding is not None:
+        meta["encoding"] = encoding
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "raw.githubusercontent.com":
+            return httpx.Response(200, content=body)
+        return httpx.Response(200, json=meta)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _mock_raw_file_client(
+    body: bytes, requests: list[httpx.Request], raw_host: bool = True, **headers: str
+) -> httpx.AsyncClient:
+    """Build a client serving a file body from the raw host, or only via the API."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "raw.githubusercontent.com":
+            if not raw_host:
+                return httpx.Response(404)
+            assert request.url.path == "/o/r/HEAD/" + request.url.path.rsplit("/", 1)[-1]
+        else:
+            assert request.headers["Accept"] == "application/vnd.github.raw"
+        return httpx.Response(200, content=body, headers=headers)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_streams_up_to_max_bytes(provider):
+    """Test that files are streamed raw and cut at max_bytes."""
+    requests: list[httpx.Request] = []
+    body = "line é\n".encode() * 200_000
+    provider._http_client = AsyncMock(return_value=_mock_raw_file_client(body, requests))
+
+    result = await provider._get_file_content("o", "r", "big.txt", max_bytes=1000)
+
+    assert result["truncated"] is True
+    assert result["size_bytes"] <= 1000
+    assert body.decode().startswith(result["content"])
+    assert result["sha"] is None
+    assert [r.url.host for r in requests] == ["raw.githubusercontent.com"]
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_raw_host_reports_blob_sha(provider):
+    """Test that a file read from the raw host still reports its git blob SHA."""
+    provider._http_client = AsyncMock(return_value=_mock_raw_file_client(b"x = 1\n", []))
+
+    result = await provider._get_file_content("o", "r", "a.py")
+
+    assert result["sha"] == "7d4290a117a4ddcc11daae7ea675841033830c8f"
+
+
+@pytest.mark.asyncio
+async def test_raw_host_misses_expire(provider):
+    """Test that a repo the raw host missed is retried there once the entry expires."""
+    requests: list[httpx.Request] = []
+    client = _mock_raw_file_client(b"x = 1\n", requests, raw_host=False)
+    provider._http_client = AsyncMock(return_value=client)
+
+    await provider._get_file_content("o", "r", "a.py")
+    with patch("src.RTFD.cache.time.monotonic", return_value=time.monotonic() + 7200):
+        await provider._get_file_content("o", "r", "b.py")
+
+    assert [r.url.host for r in requests] == [
+        "raw.githubusercontent.com",
+        "api.github.com",
+        "raw.githubusercontent.com",
+        "api.github.com",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_falls_back_to_api(provider):
+    """Test the contents API fallback, its blob SHA, and skipping the raw host after."""
+    requests: list[httpx.Request] = []
+    # git hash-object of b"x = 1\n"
+    sha = "7d4290a117a4ddcc11daae7ea675841033830c8f"
+    client = _mock_raw_file_client(b"x = 1\n", requests, raw_host=False)
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._get_file_content("o", "r", "a.py")
+    await provider._get_file_content("o", "r", "b.py")
+
+    assert result["content"] == "x = 1\n"
+    assert result["sha"] == sha
+    assert result["url"] == "https://github.com/o/r/blob/HEAD/a.py"
+    assert [r.url.host for r in requests] == [
+        "raw.githubusercontent.com",
+        "api.github.com",
+        "api.github.com",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("raw", "binary"),
+    [
+        (b"x = 1\n" * 1000 + b"\x00", True),
+        (b"x = 1\n" * 2000 + b"\x00", False),
+        (b"caf\xe9\n", True),
+    ],
+)
+def test_decode_text_bytes_sniffs_like_git(raw, binary):
+    """Test that a NUL in the first 8000 bytes or invalid UTF-8 marks a file binary."""
+    assert (_decode_text_bytes(raw) is None) is binary
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_streamed_binary_rejected(provider):
+    """Test that streamed files are still checked for binary content."""
+    body = b"\x7fELF\x02\x01\x01\x00" + b"\x00" * 2_000_000
+    provider._http_client = AsyncMock(return_value=_mock_raw_file_client(body, []))
+
+    result = await provider._get_file_content("o", "r", "big.bin")
+
+    assert result["error"] == "File appears to be binary"
+    assert result["truncated"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "kind"),
+    [([{"name": "a.py", "type": "file"}], "dir"), ({"type": "submodule"}, "submodule")],
+)
+async def test_get_file_content_rejects_non_files(provider, payload, kind):
+    """Test that JSON metadata returned for non-file paths becomes an error."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "raw.githubusercontent.com":
+            return httpx.Response(404)
+        return httpx.Response(200, json=payload)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._get_file_content("o", "r", "sub")
+
+    assert result["error"] == f"Path is a {kind}, not a file"
+
+
+@pytest.mark.asyncio
+async def test_fetch_github_readme_links_follow_html_url(provider):
+    """Test that relative links resolve against the README's html_url directory."""
+    encoded = base64.b64encode(b"[guide](guide.md)\n").decode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "content": encoded,
+                "encoding": "base64",
+                "path": "docs/README.md",
+                "html_url": "https://github.com/o/r/blob/master/docs/README.md",
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._fetch_github_readme("o", "r")
+
+    assert result["content"].startswith("[guide](https://github.com/o/r/blob/master/docs/guide.md)")
+
+
+@pytest.mark.asyncio
+async def test_fetch_github_readme_cuts_inline_content_before_decoding(provider):
+    """Test that inline READMEs are cut to max_bytes and still get absolute links."""
+    body = "[docs](docs/index.md) é\n".encode() * 5000
+    encoded = base64.encodebytes(body).decode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"content": encoded, "path": "README.md"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._fetch_github_readme("o", "r", max_bytes=1000)
+
+    assert result["truncated"] is True
+    assert result["size_bytes"] <= 1000
+    assert result["content"].startswith("[docs](https://github.com/o/r/blob/HEAD/docs/index.md)")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", ["none", None])
+async def test_fetch_github_readme_streams_large_readme(provider, encoding):
+    """Test that a README without inline base64 content is streamed up to max_bytes."""
+    requests: list[httpx.Request] = []
+    body = b"# Big\n" + b"text " * 500_000
+    client = _mock_large_file_client(body, requests, encoding)
+    provider._http_client = AsyncMock(return_value=client)
+
+    result = await provider._fetch_github_readme("o", "r", max_bytes=2048)
+    cached = await provider._fetch_github_readme("o", "r", max_bytes=2048)
+
+    assert result["truncated"] is True
+    assert result["content"].startswith("# Big\n")
+    assert result["size_bytes"] <= 2048
+    assert cached == result
+    assert [r.url.host for r in requests].count("raw.githubusercontent.com") == 1
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_revalidates_with_last_modified(provider):
+    """Test that Last-Modified is replayed as If-Modified-Since on revalidation."""
+    requests: list[httpx.Request] = []
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-Modified-Since") == stamp:
+            return httpx.Response(304)
+        return httpx.Response(200, json=[1, 2], headers={"Last-Modified": stamp})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    url = "https://api.github.com/repos/o/r/contents/"
+
+    assert await provider._get_json(url, {}) == [1, 2]
+    stale_at = time.monotonic() + provider.RESPONSE_CACHE_TTL + 1
+    with patch("src.RTFD.providers.github.time.monotonic", return_value=stale_at):
+        assert await provider._get_json(url, {}) == [1, 2]
+
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_github_get_json_retries_unexpected_not_modified(provider):
+    """Test that a 304 with no cached body falls back to an unconditional GET."""
+    responses = [httpx.Response(304), httpx.Response(200, json={"ok": True})]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+
+    assert await provider._get_json("https://api.github.com/repos/o/r", {}) == {"ok": True}
+    assert not responses
+
+
+@pytest.mark.asyncio
+async def test_github_response_cache_keyed_on_accept(provider):
+    """Test that different Accept headers are cached separately."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"accept": request.headers["Accept"]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    url = "https://api.github.com/repos/o/r"
+
+    first = await provider._get_json(url, {"Accept": "application/vnd.github+json"})
+    second = await provider._get_json(url, {"Accept": "application/json"})
+
+    assert first != second
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_tool_fetches_paths_concurrently(provider):
+    """Test that a list of paths is fetched concurrently and returned in order."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        name = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, content=f"# {name}\n".encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    get_file_content = provider.get_tools()["get_file_content"]
+
+    result = await get_file_content("o/r", ["a.py", "b.py", "c.py"])
+    data = json.loads(result.content[0].text)
+
+    assert data["count"] == 3
+    assert [f["content"] for f in data["files"]] == ["# a.py\n", "# b.py\n", "# c.py\n"]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_tool_fetches_repeated_paths_once(provider):
+    """Test that a path listed twice in one batch costs a single request."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        name = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, content=f"# {name}\n".encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider._http_client = AsyncMock(return_value=client)
+    get_file_content = provider.get_tools()["get_file_content"]
+
+    result = await get_file_content("o/r", ["a.py", "b.py", "a.py"])
+    data = json.loads(result.content[0].text)
+
+    assert [f["path"] for f in data["files"]] == ["a.py", "b.py", "a.py"]
+    assert data["count"] == 3
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_tool_rejects_oversized_batches(provider):
+    """Test that batches above MAX_BATCH_FILES are rejected without requests."""
+    provider._http_client = AsyncMock()
+    get_file_content = provider.get_tools()["get_file_content"]
+
+    paths = [f"f{i}.py" for i in range(provider.MAX_BATCH_FILES + 1)]
+    data = json.loads((await get_file_content("o/r", paths)).content[0].text)
+
+    assert "Too many paths" in data["error"]
+    provider._http_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("tool", "args", "empty_field"),
+    [
+        ("fetch_github_readme", (), "content"),
+        ("list_repo_contents", (), "contents"),
+        ("get_file_content", ("a.py",), "content"),
+        ("get_repo_tree", (), "tree"),
+        ("get_repo_overview", (), "tree"),
+        ("get_commit_diff", ("a", "b"), "diff"),
+    ],
+)
+async def test_github_tools_reject_invalid_repo(provider, tool, args, empty_field):
+    """Test that malformed repo arguments return an error without any request."""
+    provider._http_client = AsyncMock()
+    result = await provider.get_tools()[tool]("owner/repo/extra", *args)
+    data = json.loads(result.content[0].text)
+
+    assert data["repository"] == "owner/repo/extra"
+    assert data["error"] == "Invalid repo format. Use 'owner/repo'"
+    assert not data[empty_field]
+    provider._http_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["", "/etc/passwd", "docs/../../secret"])
+async def test_get_file_content_rejects_invalid_paths_locally(provider, path):
+    """Test that empty, absolute, and parent-relative paths make no request."""
+    provider._http_client = AsyncMock()
+
+    result = await provider._get_file_content("o", "r", path)
+
+    assert result["error"].startswith("Invalid path")
+    provider._http_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_commit_diff_same_refs_skips_request(provider):
+    """Test that comparing a ref with itself returns an empty diff locally."""
+    provider._http_client = AsyncMock()
+
+    result = await provider._get_commit_diff("o", "r", "main", "main")
+
+    assert result["diff"] == ""
+    assert result["truncated"] is False
+    provider._http_client.assert_not_called()
@@ -46,6 +46,7 @@ async def test_npm_search_success(provider, mock_npm_data):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_npm_data
     mock_response.text = json.dumps(mock_npm_data)
+    mock_response.content = json.dumps(mock_npm_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_client = AsyncMock()
@@ -93,6 +94,7 @@ async def test_npm_metadata_tool(provider, mock_npm_data):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_npm_data
     mock_response.text = json.dumps(mock_npm_data)
+    mock_response.content = json.dumps(mock_npm_data).encode()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -111,12 +113,32 @@ async def test_npm_metadata_tool(provider, mock_npm_data):
     assert "example-pkg" in result.content[0].text
 
 
+@pytest.mark.asyncio
+async def test_npm_reuses_shared_client(mock_npm_data):
+    """Test that consecutive lookups share one pooled client instead of opening new ones."""
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(mock_npm_data).encode()
+
+    mock_client = AsyncMock(is_closed=False)
+    mock_client.get.return_value = mock_response
+    factory = AsyncMock(return_value=mock_client)
+    provider = NpmProvider(factory)
+
+    await provider.search_library("example-pkg")
+    await provider.search_library("other-pkg")
+
+    factory.assert_awaited_once()
+    assert mock_client.get.await_count == 2
+    mock_client.__aexit__.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_fetch_npm_docs(provider, mock_npm_data):
     """Test fetching NPM docs (README)."""
     mock_response = MagicMock()
     mock_response.json.return_value = mock_npm_data
     mock_response.text = json.dumps(mock_npm_data)
+    mock_response.content = json.dumps(mock_npm_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_client = AsyncMock()
@@ -145,6 +167,7 @@ async def test_fetch_npm_docs_minimal(provider, mock_npm_data):
     mock_response = MagicMock()
     mock_response.json.return_value = mock_data
     mock_response.text = json.dumps(mock_data)
+    mock_response.content = json.dumps(mock_data).encode()
 
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
@@ -1,5 +1,7 @@
 """Tests for PyPI provider."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from src.RTFD.providers.pypi import PyPIProvider
@@ -82,3 +84,15 @@ async def test_pypi_metadata_tool(provider):
     assert "requests" in text_content  # Should contain package name
     assert "2." in text_content  # Should contain version number
     assert "{" in text_content  # Should be JSON
+
+
+@pytest.mark.asyncio
+async def test_pypi_fetch_docs_reports_byte_size(provider):
+    """Test that docs size and truncation are measured in UTF-8 bytes."""
+    metadata = {"description": "# Título\n\n" + "é" * 400, "project_urls": {}}
+    with patch.object(provider, "_fetch_metadata", AsyncMock(return_value=metadata)):
+        result = await provider._fetch_pypi_docs("pkg", max_bytes=300)
+
+    assert result["truncated"] is True
+    assert result["size_bytes"] == len(result["content"].encode("utf-8"))
+    assert result["size_bytes"] <= 300
@@ -0,0 +1,70 @@
+"""Tests for client-side rate limiting helpers."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.RTFD.rate_limit import BackoffGate, TokenBucket, retry_after_seconds
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_initial_burst():
+    """Test that a full bucket does not sleep for requests within capacity."""
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(3):
+            await bucket.acquire()
+
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_drained():
+    """Test that a drained bucket sleeps roughly one refill interval."""
+    bucket = TokenBucket(rate=2.0, capacity=1)
+    await bucket.acquire()
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await bucket.acquire()
+
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.await_args.args[0] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_zero_rate_disables_pacing():
+    """Test that a non-positive rate never sleeps."""
+    bucket = TokenBucket(rate=0)
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(10):
+            await bucket.acquire()
+
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_backoff_gate_holds_callers_until_resume():
+    """Test that a paused gate sleeps until resume and never shortens a pause."""
+    gate = BackoffGate()
+
+    with patch("src.RTFD.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await gate.wait()
+        mock_sleep.assert_not_called()
+
+        gate.pause(5.0)
+        gate.pause(1.0)
+        await gate.wait()
+
+    mock_sleep.assert_awaited_once()
+    assert 4 < mock_sleep.await_args.args[0] <= 5.0
+
+
+def test_retry_after_seconds_parses_delay():
+    """Test Retry-After parsing, defaults, and the upper bound."""
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert retry_after_seconds(httpx.Response(429), default=2.0) == 2.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "bogus"})) == 1.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "600"})) == 30.0
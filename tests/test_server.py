@@ -1,5 +1,7 @@
 """Tests for MCP server and aggregator."""
 
+import asyncio
+import json
 import time
 
 import pytest
@@ -89,8 +91,9 @@ async def test_search_library_docs_returns_json_string():
     text_content = result.content[0].text
     assert isinstance(text_content, str)
     # Check for JSON format indicators
-    assert '{"library": "requests"' in text_content
-    assert '"pypi":' in text_content
+    data = json.loads(text_content)
+    assert data["library"] == "requests"
+    assert "pypi" in data
 
 
 @pytest.mark.asyncio
@@ -176,6 +179,48 @@ async def test_locate_library_docs_uses_cache(monkeypatch):
     # but the result being the cached data is strong evidence if the cached data is unique)
 
 
+@pytest.mark.asyncio
+async def test_locate_library_docs_queries_providers_concurrently(monkeypatch):
+    """Test that providers are searched at once and merged in provider order."""
+    from src.RTFD import server
+    from src.RTFD.providers.base import ProviderMetadata, ProviderResult
+
+    in_flight = 0
+    peak = 0
+
+    class FakeProvider:
+        def __init__(self, name, searchable=True):
+            self.name = name
+            self.searchable = searchable
+
+        def get_metadata(self):
+            return ProviderMetadata(
+                name=self.name, description="", supports_library_search=self.searchable
+            )
+
+        async def search_library(self, library, limit=5):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if self.name == "godocs":
+                return ProviderResult(success=False, error="boom", provider_name=self.name)
+            return ProviderResult(success=True, data=[library], provider_name=self.name)
+
+    fakes = {
+        name: FakeProvider(name, searchable=name != "zig")
+        for name in ("pypi", "github", "godocs", "zig")
+    }
+    monkeypatch.setenv("RTFD_CACHE_ENABLED", "false")
+    monkeypatch.setattr(server, "_get_provider_instances", lambda: fakes)
+
+    result = await _locate_library_docs("lib")
+
+    assert peak == 3
+    assert list(result) == ["library", "pypi", "github_repos", "godocs_error"]
+
+
 @pytest.mark.asyncio
 async def test_get_cache_info(monkeypatch):
     """Test get_cache_info tool."""
@@ -195,5 +240,6 @@ async def test_get_cache_info(monkeypatch):
 
     assert result.content[0].type == "text"
     text_content = result.content[0].text
-    assert '"entry_count": 10' in text_content
-    assert '"db_path": "/tmp/test.db"' in text_content
+    stats = json.loads(text_content)
+    assert stats["entry_count"] == 10
+    assert stats["db_path"] == "/tmp/test.db"
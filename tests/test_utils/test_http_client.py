@@ -0,0 +1,27 @@
+"""Tests for create_http_client in utils.py."""
+
+import pytest
+
+from src.RTFD.utils import USER_AGENT, create_http_client
+
+
+@pytest.mark.asyncio
+async def test_create_http_client_advertises_compression():
+    """Test that the shared client keeps httpx's compressed-transfer defaults."""
+    client = await create_http_client()
+    try:
+        encodings = client.headers["Accept-Encoding"].split(", ")
+        assert {"gzip", "br", "zstd"} <= set(encodings)
+        assert client.headers["User-Agent"] == USER_AGENT
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_create_http_client_fails_fast_on_connect():
+    """Test that connecting times out sooner than reading a slow response."""
+    client = await create_http_client()
+    try:
+        assert client.timeout.connect < client.timeout.read
+    finally:
+        await client.aclose()
@@ -0,0 +1,25 @@
+"""Tests for safe_json_loads in utils.py."""
+
+import json
+
+import pytest
+
+from src.RTFD.utils import safe_json_loads
+
+
+@pytest.mark.parametrize("payload", ['{"name": "nginx"}', b'{"name": "nginx"}'])
+def test_safe_json_loads_accepts_str_and_bytes(payload):
+    """Test that both decoded text and raw response bytes are parsed."""
+    assert safe_json_loads(payload) == {"name": "nginx"}
+
+
+@pytest.mark.parametrize("payload", ['{"readme": "line1\nline2"}', b'{"readme": "line1\nline2"}'])
+def test_safe_json_loads_tolerates_control_characters(payload):
+    """Test that unescaped control characters inside strings are tolerated."""
+    assert safe_json_loads(payload) == {"readme": "line1\nline2"}
+
+
+def test_safe_json_loads_invalid_json_raises():
+    """Test that malformed JSON still raises JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        safe_json_loads(b'{"name": ')
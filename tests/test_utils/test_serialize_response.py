@@ -0,0 +1,45 @@
+"""Tests for response serialization helpers in utils.py."""
+
+import json
+
+import pytest
+
+from src.RTFD.utils import serialize_response, serialize_response_with_meta
+
+
+def test_serialize_response_emits_bytes_as_text():
+    """Test that bytes values are serialized as UTF-8 text, not their repr."""
+    payload = {"diff": "+café\n".encode(), "view": memoryview(b"abc")}
+
+    assert json.loads(serialize_response(payload)) == {"diff": "+café\n", "view": "abc"}
+
+
+def test_serialize_response_with_meta_falls_back_to_str():
+    """Test that bytes become text and other objects fall back to str()."""
+    result = serialize_response_with_meta({"content": "é".encode(), "items": {1, 2} - {2}})
+    text = result.content[0].text
+
+    assert json.loads(text) == {"content": "é", "items": "{1}"}
+
+
+def test_serialize_response_is_compact_utf8():
+    """Test compact separators and non-ASCII text emitted as UTF-8, not \\u escapes."""
+    assert serialize_response({"content": "é", "n": [1, 2]}) == '{"content":"é","n":[1,2]}'
+
+
+def test_serialize_response_with_meta_is_compact_utf8():
+    """Test that tool results use the same compact UTF-8 format."""
+    result = serialize_response_with_meta({"content": "日本", "size": 6})
+
+    assert result.content[0].text == '{"content":"日本","size":6}'
+
+
+def test_serialize_response_escapes_control_characters():
+    """Test that control characters stay escaped in the compact output."""
+    assert serialize_response({"s": "a\nb\x01"}) == '{"s":"a\\nb\\u0001"}'
+
+
+@pytest.mark.parametrize("payload", [{1: "a"}, {"n": 2**70}, {"s": "\ud800"}])
+def test_serialize_response_round_trips_orjson_edge_cases(payload):
+    """Test non-str keys, big integers, and lone surrogates still serialize."""
+    assert json.loads(serialize_response(payload)) == {str(k): v for k, v in payload.items()}